@@ -0,0 +1,105 @@
+"""
+Count the elements and bytes emitted for the CSS adjustments per rerun.
+
+The CSS adjustments are emitted as a single ``st.html``, which also positions
+the body. This script emits them in an app run by
+``streamlit.testing.v1.AppTest``, counts their forward messages and bytes,
+and checks that the content of the messages is the same on every rerun where
+the arguments do not change.
+
+Usage: python benchmarks/css_emission.py
+
+Exits with status 1 if the CSS adjustments are emitted as more than one
+element, or if their content changes between reruns with the same arguments.
+"""
+
+import hashlib
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def emission_app(styles, options):
+    """Emit the CSS adjustments and store the messages in the state."""
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    from streamlit_navigation_bar import core
+    from streamlit_navigation_bar.match_navbar import (
+        get_config_theme,
+        match_ui,
+    )
+
+    ui = match_ui(styles, get_config_theme())
+    options = core._prepare_options(options)
+    css = core._render_css(ui, options, None, core.get_path("templates"))
+    key = "st_navbar_key_navbar"
+
+    ctx = get_script_run_ctx()
+    enqueue = ctx._enqueue
+    messages = []
+
+    def recording_enqueue(msg):
+        # The metadata holds the position of the delta, which does not change.
+        messages.append(msg.delta.SerializeToString(deterministic=True))
+        enqueue(msg)
+
+    ctx._enqueue = recording_enqueue
+    try:
+        core._emit_css(css, key, options["use_padding"])
+    finally:
+        ctx._enqueue = enqueue
+
+    st.session_state["messages"] = messages
+
+
+def measure(styles, options):
+    """Get the elements, bytes and whether the content was stable."""
+    app_test = AppTest.from_function(emission_app, args=(styles, options))
+    digests = set()
+    for _ in range(3):
+        app_test.run(timeout=30)
+        if app_test.exception:
+            raise RuntimeError(app_test.exception[0].message)
+        messages = app_test.session_state["messages"]
+        digests.add(hashlib.sha256(b"".join(messages)).hexdigest())
+    size = sum(len(message) for message in messages)
+    return len(messages), size, len(digests) == 1
+
+
+def main():
+    sys.path.insert(0, ROOT)
+    cases = {
+        "default": (None, True),
+        "styled": (
+            {
+                "nav": {"background-color": "royalblue", "height": "3.5rem"},
+                "hover": {"color": "white"},
+            },
+            True,
+        ),
+        "no options": (None, False),
+    }
+    print(f"{'case':<11} {'elements':>8} {'bytes':>7} {'stable':>7}")
+    failures = []
+    for name, (styles, options) in cases.items():
+        elements, size, stable = measure(styles, options)
+        print(
+            f"{name:<11} {elements:>8} {size:>7} "
+            f"{'yes' if stable else 'no':>7}"
+        )
+        if elements != 1:
+            failures.append(f"{name}: {elements} elements instead of 1")
+        if not stable:
+            failures.append(f"{name}: the content changed between reruns")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
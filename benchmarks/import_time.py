@@ -0,0 +1,120 @@
+"""
+Measure the import time of the package and guard the lazy imports.
+
+Each command is run in a new interpreter with ``-X importtime``, and its
+report is parsed to get the modules imported and the time spent importing the
+package and what it imports, lazily or not. The package itself and the
+command line interface must not import Streamlit or Jinja, which are only
+imported on the first use of the navbar.
+
+Usage: python benchmarks/import_time.py [--budget-ms 50] [--runs 5]
+
+Exits with status 1 if a command imports a forbidden module, or if the
+median import time of the package is over the budget.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "streamlit_navigation_bar"
+FORBIDDEN = ("streamlit", "jinja2")
+
+# The commands and whether they must stay free of the forbidden modules.
+COMMANDS = {
+    "import": (["-c", f"import {PACKAGE}"], True),
+    "cli": (["-m", PACKAGE], True),
+    "st_navbar": (["-c", f"from {PACKAGE} import st_navbar"], False),
+}
+
+
+def parse_importtime(report):
+    """
+    Parse the report of ``-X importtime``.
+
+    Returns
+    -------
+    modules : set of str
+        The names of all the imported modules.
+    package_us : int
+        The cumulative import time of the package and of everything imported
+        after it, in microseconds.
+    """
+    modules = set()
+    package_us = 0
+    after_package = False
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # The header of the report.
+        name = fields[2].strip()
+        modules.add(name)
+        # Nested imports are indented, so only top-level ones are summed. The
+        # modules imported lazily by the package are reported at the top
+        # level, after it.
+        if fields[2][1:2] == " ":
+            continue
+        after_package = after_package or name == PACKAGE
+        if after_package:
+            package_us += int(fields[1])
+    return modules, package_us
+
+
+def run(args):
+    """Run a command with ``-X importtime`` and parse its report."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=50.0,
+        help="maximum median import time of the package (default: 50)",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="runs per command (default: 5)"
+    )
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'command':<10} {'median (ms)':>12}  forbidden modules")
+    for name, (command, lazy) in COMMANDS.items():
+        times = []
+        imported = set()
+        for _ in range(args.runs):
+            modules, package_us = run(command)
+            times.append(package_us / 1000)
+            imported.update(modules)
+        median = statistics.median(times)
+        forbidden = [module for module in FORBIDDEN if module in imported]
+        print(f"{name:<10} {median:>12.1f}  {', '.join(forbidden) or '-'}")
+
+        if lazy and forbidden:
+            failures.append(f"{name} imports {', '.join(forbidden)}")
+        if lazy and median > args.budget_ms:
+            failures.append(
+                f"{name} takes {median:.1f} ms, over the budget of "
+                f"{args.budget_ms:g} ms"
+            )
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+Load test the navbar with many concurrent sessions.
+
+Streamlit runs the script of each session in its own thread, so everything at
+the module level of the package, such as the declared component, the caches
+and their locks, is used concurrently. This script simulates that: each
+session has its own state and thread, which reruns the app after a random
+click on the navbar or a random page set with ``set_page``.
+
+``AppTest.run`` sets up a mock runtime and patches the configuration globally,
+and tears them down at the end of the run, so it fails when runs overlap. So
+the mock runtime is set up once for all the sessions, and each session runs
+the same script with the runner of ``AppTest``, as a server would.
+
+It reports the throughput, the percentiles of the rerun latency and the
+contention of each lock of the package, which are instrumented while the test
+runs. It fails if a session raises an exception, returns a page other than
+the one it selected, sees the state of another session, or if a cache of the
+package is left inconsistent.
+
+Usage: python benchmarks/load_test.py [--sessions 32] [--reruns 50]
+                                      [--seed 0]
+"""
+
+import argparse
+import inspect
+import os
+import random
+import statistics
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+from unittest.mock import MagicMock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGE_SETS = 3
+PAGES = 8
+
+
+def navbar_app(session, pages, styles, use_key):
+    """Place a navbar and record the page and the session that saw it."""
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    owner = st.session_state.setdefault("owner", session)
+    page = st_navbar(
+        pages,
+        styles=styles,
+        key="navbar" if use_key else None,
+    )
+    st.session_state["seen"] = (owner, page)
+
+
+class TimedLock():
+    """Wrap a lock to count its acquisitions and the time waited for it."""
+
+    def __init__(self, lock, name):
+        self._lock = lock
+        self.name = name
+        self.acquisitions = 0
+        self.contended = 0
+        self.waited = 0.0
+
+    def acquire(self, blocking=True, timeout=-1):
+        if self._lock.acquire(blocking=False):
+            self.acquisitions += 1
+            return True
+        if not blocking:
+            return False
+        start = time.perf_counter()
+        acquired = self._lock.acquire(timeout=timeout)
+        if acquired:
+            # Counted while holding the lock, so the counters do not race.
+            self.acquisitions += 1
+            self.contended += 1
+            self.waited += time.perf_counter() - start
+        return acquired
+
+    def release(self):
+        self._lock.release()
+
+    def locked(self):
+        return self._lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+        return False
+
+
+def instrument_locks():
+    """Replace the locks of the package, including those of the caches."""
+    from streamlit_navigation_bar import (
+        cache,
+        core,
+        errors,
+        match_navbar,
+        precompile,
+        router,
+        svg,
+        timing,
+    )
+
+    lock_type = type(threading.Lock())
+    locks = []
+    for module in (core, errors, match_navbar, precompile, router, svg, timing):
+        for name, value in list(vars(module).items()):
+            label = f"{module.__name__.rpartition('.')[2]}.{name}"
+            if isinstance(value, lock_type):
+                timed = TimedLock(value, label)
+                setattr(module, name, timed)
+                locks.append(timed)
+            elif isinstance(value, cache.LRUCache):
+                timed = TimedLock(value._lock, label)
+                value._lock = timed
+                locks.append(timed)
+    return locks
+
+
+def check_caches():
+    """Get the caches of the package whose counters are inconsistent."""
+    from streamlit_navigation_bar import cache_info
+
+    failures = []
+    for name, info in cache_info().items():
+        if info["size"] > info["maxsize"] or min(info.values()) < 0:
+            failures.append(f"the {name} cache is inconsistent: {info}")
+    return failures
+
+
+def write_script(directory):
+    """Write the script of the app, as ``AppTest.from_function`` does."""
+    source = textwrap.dedent(inspect.getsource(navbar_app))
+    path = os.path.join(directory, "navbar_app.py")
+    with open(path, "w") as file:
+        file.write(f"{source}\n{navbar_app.__name__}(*__args)\n")
+    return path
+
+
+class Session():
+    """A session of the app, with its own state, rerun by a single thread."""
+
+    def __init__(self, script, script_cache, args):
+        from streamlit.runtime.state import SafeSessionState, SessionState
+
+        self.script = script
+        self.script_cache = script_cache
+        self.args = args
+        self.session_state = SafeSessionState(SessionState(), lambda: None)
+        self.exception = None
+
+    def run(self, timeout=60):
+        """Rerun the script and record the exception it showed, if any."""
+        from streamlit.runtime.scriptrunner import ScriptRunnerEvent
+        from streamlit.testing.v1.local_script_runner import (
+            LocalScriptRunner,
+        )
+
+        managers = ()
+        if "pages_manager" in inspect.signature(LocalScriptRunner).parameters:
+            # Since Streamlit 1.36, each runner needs a manager of the pages.
+            from streamlit.runtime.pages_manager import PagesManager
+
+            managers = (PagesManager(self.script, setup_watcher=False),)
+        script_runner = LocalScriptRunner(
+            self.script,
+            self.session_state,
+            *managers,
+            args=self.args,
+        )
+        # As in a server, the script is compiled once for all the sessions.
+        # Compiling it concurrently can fail in some versions of Python.
+        script_runner._script_cache = self.script_cache
+
+        errors = []
+
+        def record_error(sender, event, exception=None, **kwargs):
+            if event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR:
+                errors.append(exception)
+
+        script_runner.on_event.connect(record_error, weak=False)
+        tree = script_runner.run(timeout=timeout)
+        if errors:
+            raise RuntimeError(f"the script did not compile: {errors[0]!r}")
+        self.exception = tree.exception[0].message if tree.exception else None
+
+
+def run_session(
+    script, script_cache, session, reruns, seed, latencies, failures
+):
+    """Drive a session, recording an exception raised out of it."""
+    try:
+        drive_session(
+            script, script_cache, session, reruns, seed, latencies, failures
+        )
+    except Exception as exception:
+        failures.append(f"session {session}: {exception!r}")
+
+
+def drive_session(
+    script, script_cache, session, reruns, seed, latencies, failures
+):
+    """Drive a session with random clicks and pages set from Python."""
+    rng = random.Random(seed)
+    page_set = session % PAGE_SETS
+    pages = [f"Set {page_set} page {i}" for i in range(PAGES)]
+    styles = {"nav": {"background-color": f"#00{page_set:02d}ff"}}
+    use_key = session % 2 == 0
+
+    app_session = Session(
+        script, script_cache, (session, pages, styles, use_key)
+    )
+    component_key = None
+    clicks = 0
+    expected = pages[0]
+    action = "the first run"
+
+    for rerun in range(reruns + 1):
+        if rerun > 0:
+            expected = rng.choice(pages)
+            if use_key and rng.random() < 0.25:
+                action = f"setting the page in rerun {rerun}"
+                app_session.session_state["navbar"] = expected
+            else:
+                action = f"a click in rerun {rerun}"
+                clicks += 1
+                app_session.session_state[component_key] = {
+                    "page": expected,
+                    "theme": None,
+                    "version": None,
+                    "clicks": clicks,
+                }
+
+        start = time.perf_counter()
+        app_session.run()
+        latencies.append(time.perf_counter() - start)
+
+        if app_session.exception:
+            failures.append(f"session {session}: {app_session.exception}")
+            return
+        owner, page = app_session.session_state["seen"]
+        if owner != session:
+            failures.append(f"session {session} saw the state of {owner}")
+        if page != expected:
+            failures.append(
+                f"session {session} got {page!r} instead of {expected!r} "
+                f"after {action}"
+            )
+        if component_key is None:
+            component_key = next(
+                key
+                for key in app_session.session_state.filtered_state
+                if key.startswith("st_navbar_")
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        default=32,
+        help="concurrent sessions, one thread each (default: 32)",
+    )
+    parser.add_argument(
+        "--reruns",
+        type=int,
+        default=50,
+        help="reruns per session (default: 50)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the clicks (default: 0)"
+    )
+    args = parser.parse_args()
+    sys.path.insert(0, ROOT)
+
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import (
+        MemoryCacheStorageManager,
+    )
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.runtime.memory_media_file_storage import (
+        MemoryMediaFileStorage,
+    )
+    from streamlit.testing.v1.util import patch_config_options
+    from streamlit_navigation_bar.timing import _percentile
+
+    # All the sessions run the same script, as they would in a server.
+    directory = tempfile.TemporaryDirectory(prefix="st_navbar_load_")
+    script = write_script(directory.name)
+    script_cache = ScriptCache()
+    locks = instrument_locks()
+    mock_runtime = MagicMock(spec=Runtime)
+    mock_runtime.media_file_mgr = MediaFileManager(
+        MemoryMediaFileStorage("/mock/media")
+    )
+    mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = mock_runtime
+
+    latencies = []
+    failures = []
+    threads = [
+        threading.Thread(
+            target=run_session,
+            args=(
+                script,
+                script_cache,
+                session,
+                args.reruns,
+                args.seed * 1_000_003 + session,
+                latencies,
+                failures,
+            ),
+        )
+        for session in range(args.sessions)
+    ]
+    # The threads that drive the sessions read and write their state out of a
+    # script run, which Streamlit warns about once per access.
+    options = {"global.appTest": True, "logger.level": "error"}
+    with patch_config_options(options):
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    Runtime._instance = None
+    directory.cleanup()
+    failures.extend(check_caches())
+
+    ordered = sorted(latency * 1000 for latency in latencies)
+    print(
+        f"sessions: {args.sessions}, reruns: {len(ordered)}, "
+        f"wall: {elapsed:.2f} s, throughput: {len(ordered) / elapsed:.1f}/s"
+    )
+    if ordered:
+        print(
+            f"rerun latency (ms): mean {statistics.fmean(ordered):.2f}, "
+            f"p50 {_percentile(ordered, 0.50):.2f}, "
+            f"p95 {_percentile(ordered, 0.95):.2f}, "
+            f"p99 {_percentile(ordered, 0.99):.2f}, "
+            f"max {ordered[-1]:.2f}"
+        )
+
+    print(
+        f"\n{'lock':<30} {'acquired':>9} {'contended':>10} "
+        f"{'waited ms':>10}"
+    )
+    for lock in sorted(locks, key=lambda lock: -lock.acquisitions):
+        if lock.acquisitions:
+            print(
+                f"{lock.name:<30} {lock.acquisitions:>9} "
+                f"{lock.contended:>10} {lock.waited * 1000:>10.2f}"
+            )
+
+    for failure in failures[:20]:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Measure the bytes of the navbar arguments sent to the frontend per rerun.
+
+The first run sends the full arguments. Once they were sent, the arguments
+that do not change are no longer sent, e.g. on a rerun triggered by another
+widget. This script compares both cases for navbars of different sizes, with
+and without a large logo.
+
+Usage: python benchmarks/payload_bytes.py
+"""
+
+import os
+import sys
+import tempfile
+
+from streamlit.testing.v1 import AppTest
+
+
+def navbar_app(n_pages, logo_path):
+    """Place a navbar with `n_pages` pages."""
+    from streamlit_navigation_bar import NavbarSpec, st_navbar
+
+    pages = [f"Page {i}" for i in range(n_pages)]
+    spec = NavbarSpec.build(pages, logo_path=logo_path)
+    st_navbar(spec, key="navbar")
+
+
+def get_args_bytes(app_test):
+    """Get the size of the JSON arguments of the navbar component."""
+    for node in app_test.main:
+        proto = getattr(node, "proto", None)
+        if getattr(node, "type", None) == "component_instance":
+            return len(proto.json_args.encode("utf-8"))
+    raise RuntimeError("The navbar component was not found.")
+
+
+def make_logo(size):
+    """Write an SVG of approximately `size` bytes to a temporary file."""
+    path = os.path.join(tempfile.mkdtemp(), "logo.svg")
+    circles = "".join(
+        f'<circle cx="{i % 100}" cy="{i // 100}" r="1"/>'
+        for i in range(size // 30)
+    )
+    with open(path, "w") as file:
+        file.write(f'<svg xmlns="http://www.w3.org/2000/svg">{circles}</svg>')
+    return path
+
+
+def measure(n_pages, logo_path):
+    """Get the argument bytes of the first run and of a rerun."""
+    app_test = AppTest.from_function(navbar_app, args=(n_pages, logo_path))
+    app_test.run(timeout=30)
+    full = get_args_bytes(app_test)
+
+    # A rerun without a new value from the navbar.
+    app_test.run(timeout=30)
+    slim = get_args_bytes(app_test)
+    return full, slim
+
+
+def main():
+    sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    logo_path = make_logo(100_000)
+    print(
+        f"{'pages':>6} {'logo':>5} {'full (B)':>10} {'slim (B)':>10} "
+        f"{'saved':>7}"
+    )
+    for n_pages in (5, 50, 500):
+        for logo in (None, logo_path):
+            full, slim = measure(n_pages, logo)
+            saved = 1 - slim / full
+            has_logo = "yes" if logo else "no"
+            print(
+                f"{n_pages:>6} {has_logo:>5} {full:>10} {slim:>10} "
+                f"{saved:>7.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
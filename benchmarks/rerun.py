@@ -0,0 +1,417 @@
+"""
+Benchmark the cost of `st_navbar` per rerun, without a browser.
+
+Each case runs a navbar app with `streamlit.testing.v1.AppTest`. The first run
+of a session is measured with the caches of the process cleared, then the app
+is rerun without a new value from the navbar, as another widget would. Both
+are repeated and the median time is kept. The script measures the time spent
+inside `st_navbar`, the number of forward messages it emits and their bytes.
+One more rerun is traced with `tracemalloc` to get the peak of memory
+allocated by the call.
+
+The cases sweep the number of pages, the logo, the size of `styles`, every
+combination of `options` and `adjust`, each against a base case. Use `--full`
+to run the cartesian product instead.
+
+Usage:
+    python benchmarks/rerun.py                    # print the results
+    python benchmarks/rerun.py --save baseline    # write a new baseline
+    python benchmarks/rerun.py --check baseline   # compare to a baseline
+
+The check exits with status 1 if a metric is worse than the baseline by more
+than the threshold. Timings depend on the machine, so the baseline is saved
+locally, by default to `.benchmarks/baseline.json`, which is not tracked by
+git. Save it before changing `core.py`, `match_navbar.py` or `errors.py`, and
+check against it afterwards. A timing is only compared when its change is
+outside the noise of both measures, and a case whose timing regressed is
+measured again, to confirm it.
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, ".benchmarks", "baseline.json")
+
+PAGE_COUNTS = (5, 50, 500, 5000)
+OPTIONS = (
+    "show_menu",
+    "show_sidebar",
+    "hide_nav",
+    "fix_shadow",
+    "use_padding",
+    "use_overflow",
+)
+STYLES = {
+    "none": None,
+    "small": {
+        "nav": {"background-color": "royalblue"},
+        "span": {"color": "white"},
+    },
+    "full": {
+        "nav": {
+            "background-color": "royalblue",
+            "justify-content": "left",
+            "height": "3.5rem",
+        },
+        "div": {"max-width": "32rem"},
+        "ul": {"gap": "0.5rem"},
+        "li": {"padding": "0 0.25rem"},
+        "a": {"text-decoration": "none"},
+        "img": {"padding-right": "14px", "width": "2rem"},
+        "span": {
+            "color": "white",
+            "border-radius": "0.5rem",
+            "padding": "0.4375rem 0.625rem",
+            "margin": "0 0.125rem",
+        },
+        "active": {
+            "background-color": "rgba(255, 255, 255, 0.25)",
+            "font-weight": "normal",
+        },
+        "hover": {"background-color": "rgba(255, 255, 255, 0.35)"},
+    },
+}
+BASE = {
+    "pages": 5,
+    "logo": False,
+    "styles": "none",
+    # The options of ``options=True``, which leaves "use_overflow" off.
+    "options": (True,) * (len(OPTIONS) - 1) + (False,),
+    "adjust": True,
+}
+
+# Metrics compared by the check. The timings and allocations depend on the
+# machine, the messages and their bytes do not. The wall time of the whole
+# rerun is stored too, but it is dominated by `AppTest` itself. Each timing is
+# stored with its noise, the median absolute deviation of its runs.
+METRICS = (
+    "first_ms",
+    "rerun_ms",
+    "first_msgs",
+    "rerun_msgs",
+    "first_bytes",
+    "rerun_bytes",
+    "peak_kib",
+)
+
+# How many times its noise a timing has to change by to be compared.
+NOISE_FACTOR = 3
+
+# Minimum number of reruns of a case measured again to confirm a regression.
+CONFIRM_RERUNS = 7
+
+
+def navbar_app(pages, logo_path, styles, options, adjust):
+    """Place a navbar and store the measures of the call in the state."""
+    import time
+    import tracemalloc
+
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    from streamlit_navigation_bar import st_navbar
+
+    ctx = get_script_run_ctx()
+    enqueue = ctx._enqueue
+    sizes = []
+
+    def counting_enqueue(msg):
+        sizes.append(msg.ByteSize())
+        enqueue(msg)
+
+    trace = st.session_state.get("bench_trace", False)
+    ctx._enqueue = counting_enqueue
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        st_navbar(
+            pages,
+            logo_path=logo_path,
+            styles=styles,
+            options=options,
+            adjust=adjust,
+            key="navbar",
+        )
+    finally:
+        elapsed = time.perf_counter() - start
+        ctx._enqueue = enqueue
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    st.session_state["bench"] = {
+        "ms": elapsed * 1000,
+        "msgs": len(sizes),
+        "bytes": sum(sizes),
+        "peak": peak,
+    }
+
+
+def make_logo():
+    """Write an SVG logo of a few kilobytes to a temporary file."""
+    path = os.path.join(tempfile.mkdtemp(), "logo.svg")
+    shapes = "".join(
+        f'<circle cx="{12 + i % 8 * 4}" cy="{12 + i // 8 * 4}" r="1.5"/>'
+        for i in range(64)
+    )
+    with open(path, "w") as file:
+        file.write(
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 48 48">'
+            f"{shapes}</svg>"
+        )
+    return path
+
+
+def get_cases(full):
+    """Get the cases of the sweep, or of the cartesian product if `full`."""
+    toggles = itertools.product((True, False), repeat=len(OPTIONS))
+    dimensions = {
+        "pages": PAGE_COUNTS,
+        "logo": (False, True),
+        "styles": tuple(STYLES),
+        "options": tuple(toggles),
+        "adjust": (True, False),
+    }
+    if full:
+        names = list(dimensions)
+        return [
+            dict(zip(names, values))
+            for values in itertools.product(*dimensions.values())
+        ]
+
+    cases = [BASE]
+    for name, values in dimensions.items():
+        for value in values:
+            if value != BASE[name]:
+                cases.append({**BASE, name: value})
+    return cases
+
+
+def clear_caches():
+    """Clear the caches that the navbar shares across sessions."""
+    import streamlit_navigation_bar as navbar
+
+    navbar.errors._validated.clear()
+    navbar.match_navbar._ui_cache.clear()
+    navbar._css_cache.clear()
+    navbar._logo_cache.clear()
+    navbar._spec_cache.clear()
+    gc.collect()
+
+
+def case_id(case):
+    """Get a readable and stable identifier for a case."""
+    options = "".join("1" if toggle else "0" for toggle in case["options"])
+    return (
+        f"pages={case['pages']},logo={'on' if case['logo'] else 'off'},"
+        f"styles={case['styles']},options={options},"
+        f"adjust={'on' if case['adjust'] else 'off'}"
+    )
+
+
+def get_noise(timings):
+    """Get the median absolute deviation of timings."""
+    median = statistics.median(timings)
+    return statistics.median(abs(timing - median) for timing in timings)
+
+
+def run_case(case, logo_path, reruns):
+    """Run the app of a case and get its metrics."""
+    pages = [f"Page {i}" for i in range(case["pages"])]
+    logo = logo_path if case["logo"] else None
+    styles = STYLES[case["styles"]]
+    options = dict(zip(OPTIONS, case["options"]))
+    args = (pages, logo, styles, options, case["adjust"])
+
+    # The first run of a session, with the caches of the process empty.
+    firsts = []
+    for _ in range(reruns):
+        clear_caches()
+        app_test = AppTest.from_function(navbar_app, args=args)
+        app_test.run(timeout=60)
+        if app_test.exception:
+            raise RuntimeError(app_test.exception[0].message)
+        firsts.append(app_test.session_state["bench"])
+    first = firsts[-1]
+
+    timings = []
+    walls = []
+    for _ in range(reruns):
+        wall = time.perf_counter()
+        app_test.run(timeout=60)
+        walls.append((time.perf_counter() - wall) * 1000)
+        timings.append(app_test.session_state["bench"]["ms"])
+    rerun = app_test.session_state["bench"]
+
+    app_test.session_state["bench_trace"] = True
+    app_test.run(timeout=60)
+    traced = app_test.session_state["bench"]
+
+    first_timings = [b["ms"] for b in firsts]
+    return {
+        "first_ms": round(statistics.median(first_timings), 3),
+        "first_ms_noise": round(get_noise(first_timings), 3),
+        "rerun_ms": round(statistics.median(timings), 3),
+        "rerun_ms_noise": round(get_noise(timings), 3),
+        "rerun_wall_ms": round(statistics.median(walls), 3),
+        "first_msgs": first["msgs"],
+        "rerun_msgs": rerun["msgs"],
+        "first_bytes": first["bytes"],
+        "rerun_bytes": rerun["bytes"],
+        "peak_kib": round(traced["peak"] / 1024, 1),
+    }
+
+
+def run(cases, logo_path, reruns):
+    """Run every case and get the results keyed by case identifier."""
+    # Import and warm up everything first, so it is not counted in a case.
+    run_case(BASE, logo_path, 1)
+    results = {}
+    for index, case in enumerate(cases, start=1):
+        identifier = case_id(case)
+        results[identifier] = run_case(case, logo_path, reruns)
+        print(f"[{index}/{len(cases)}] {identifier}", file=sys.stderr)
+    return results
+
+
+def check(results, baseline, threshold, min_ms):
+    """Get the metrics that are worse than the baseline by the threshold."""
+    regressions = []
+    for identifier, metrics in results.items():
+        expected = baseline.get(identifier)
+        if expected is None:
+            continue
+        for metric in METRICS:
+            old, new = expected[metric], metrics[metric]
+            if metric.endswith("_ms"):
+                # Ignore timing changes that cannot be told apart from the
+                # noise of either measure.
+                noise = max(
+                    expected.get(f"{metric}_noise", 0),
+                    metrics.get(f"{metric}_noise", 0),
+                )
+                if new - old <= max(min_ms, NOISE_FACTOR * noise):
+                    continue
+            if new > old * (1 + threshold):
+                regressions.append((identifier, metric, old, new))
+    return regressions
+
+
+def confirm(regressions, cases, results, logo_path, reruns):
+    """Measure again the cases whose timing regressed, keeping the best."""
+    identifiers = {
+        identifier
+        for identifier, metric, _, _ in regressions
+        if metric.endswith("_ms")
+    }
+    for case in cases:
+        identifier = case_id(case)
+        if identifier not in identifiers:
+            continue
+        print(f"[again] {identifier}", file=sys.stderr)
+        again = run_case(case, logo_path, max(reruns, CONFIRM_RERUNS))
+        for metric in ("first_ms", "rerun_ms"):
+            if again[metric] < results[identifier][metric]:
+                results[identifier][metric] = again[metric]
+                noise = f"{metric}_noise"
+                results[identifier][noise] = again[noise]
+
+
+def print_results(results):
+    """Print the results as a table."""
+    header = ["case"] + list(METRICS)
+    print("  ".join(header))
+    for identifier, metrics in results.items():
+        row = [identifier] + [str(metrics[metric]) for metric in METRICS]
+        print("  ".join(row))
+
+
+def main():
+    sys.path.insert(0, ROOT)
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--full", action="store_true", help="run the cartesian product"
+    )
+    parser.add_argument(
+        "--reruns", type=int, default=7, help="timed runs per case"
+    )
+    parser.add_argument(
+        "--save",
+        nargs="?",
+        const=BASELINE,
+        metavar="PATH",
+        help="write the results as a baseline",
+    )
+    parser.add_argument(
+        "--check",
+        nargs="?",
+        const=BASELINE,
+        metavar="PATH",
+        help="compare the results to a baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="relative change tolerated by the check (default: 0.25)",
+    )
+    parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=1.0,
+        help="smallest timing change reported by the check (default: 1.0)",
+    )
+    args = parser.parse_args()
+
+    import streamlit
+
+    logo_path = make_logo()
+    cases = get_cases(args.full)
+    results = run(cases, logo_path, args.reruns)
+
+    if args.check:
+        with open(args.check) as file:
+            baseline = json.load(file)["results"]
+        regressions = check(results, baseline, args.threshold, args.min_ms)
+        if regressions:
+            confirm(regressions, cases, results, logo_path, args.reruns)
+    print_results(results)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "streamlit": streamlit.__version__,
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+            file.write("\n")
+
+    if args.check:
+        regressions = check(results, baseline, args.threshold, args.min_ms)
+        for identifier, metric, old, new in regressions:
+            print(f"REGRESSION {identifier} {metric}: {old} -> {new}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression above {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Measure the memory retained by the navbar in each session.
+
+Sessions are simulated with ``streamlit.testing.v1.AppTest``, kept alive
+after they run the app, select another page and rerun. The memory is traced
+with ``tracemalloc``, and the memory retained per session is the difference
+between the memory retained after all the sessions and after the first one,
+divided by the number of additional sessions. This way, the data shared by
+all sessions, such as the caches of the process, is not counted.
+
+The memory attributed to the navbar is the one allocated while a frame of the
+package was on the stack, most of it by Streamlit, for the state of the
+component. The memory allocated by the code of the package itself, i.e. the
+state the navbar keeps in each session, is reported apart. Both are reported
+along with the memory retained by everything in the sessions. Finally, the
+size of the state the navbar keeps in the session state is reported, as given
+by ``sys.getsizeof``, which does not depend on the allocator.
+
+Usage: python benchmarks/session_memory.py [--sessions 200] [--pages 10]
+                                           [--top N]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_DIR = os.path.join(ROOT, "streamlit_navigation_bar")
+
+
+def navbar_app(n_pages, logo_path):
+    """Place a navbar with a logo, styles and a key."""
+    from streamlit_navigation_bar import st_navbar
+
+    styles = {
+        "nav": {"background-color": "royalblue"},
+        "span": {"color": "white"},
+        "hover": {"background-color": "rgba(255, 255, 255, 0.25)"},
+    }
+    st_navbar(
+        [f"Page {i}" for i in range(n_pages)],
+        logo_path=logo_path,
+        styles=styles,
+        key="navbar",
+    )
+
+
+def run_session(n_pages, logo_path):
+    """Run a session, select another page, and return it to keep it alive."""
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_function(navbar_app, args=(n_pages, logo_path))
+    app_test.run(timeout=30)
+    app_test.session_state["st_navbar_navbar"] = {
+        "page": "Page 1",
+        "theme": None,
+        "version": None,
+        "clicks": 1,
+    }
+    app_test.run(timeout=30)
+    if app_test.exception:
+        raise RuntimeError(app_test.exception[0].message)
+    return app_test
+
+
+def retained(snapshot):
+    """
+    Get the bytes retained in total, attributed to the navbar and allocated
+    by the code of the package itself.
+    """
+    pattern = f"{PACKAGE_DIR}{os.sep}*"
+    navbar = snapshot.filter_traces(
+        [tracemalloc.Filter(True, pattern, all_frames=True)]
+    )
+    own = snapshot.filter_traces([tracemalloc.Filter(True, pattern)])
+    return tuple(
+        sum(stat.size for stat in traces.statistics("filename"))
+        for traces in (snapshot, navbar, own)
+    )
+
+
+def deep_size(value, seen):
+    """Get the size of an object and of everything it holds, once each."""
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            deep_size(key, seen) + deep_size(item, seen)
+            for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(deep_size(item, seen) for item in value)
+    elif hasattr(value, "__slots__"):
+        size += sum(
+            deep_size(getattr(value, name), seen)
+            for name in value.__slots__
+            if hasattr(value, name)
+        )
+    return size
+
+
+def state_size(app_test):
+    """Get the size of the state the navbar keeps in a session."""
+    seen = set()
+    state = app_test.session_state
+    return sum(
+        deep_size(name, seen) + deep_size(state[name], seen)
+        for name in ("_st_navbar", "_st_navbar_changes", "navbar")
+        if name in state
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sessions", type=int, default=200, help="sessions (default: 200)"
+    )
+    parser.add_argument(
+        "--pages", type=int, default=10, help="pages (default: 10)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=0, help="show the top allocation sites"
+    )
+    args = parser.parse_args()
+    sys.path.insert(0, ROOT)
+    logo_path = os.path.join(ROOT, "examples", "st_navbar_3", "cubes.svg")
+
+    # The first session fills the caches of the process and of Streamlit.
+    sessions = [run_session(args.pages, logo_path)]
+    tracemalloc.start(25)
+    sessions.append(run_session(args.pages, logo_path))
+    gc.collect()
+    first = tracemalloc.take_snapshot()
+
+    for _ in range(args.sessions - 1):
+        sessions.append(run_session(args.pages, logo_path))
+    gc.collect()
+    last = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    added = args.sessions - 1
+    labels = ("total", "navbar", "navbar code")
+    print(f"sessions: {args.sessions}, pages: {args.pages}")
+    print("retained per session:")
+    for label, before, after in zip(labels, retained(first), retained(last)):
+        print(f"  {label:<12} {(after - before) / added:>8,.0f} B")
+    print(f"navbar session state: {state_size(sessions[-1]):,} B")
+
+    if args.top:
+        navbar = [
+            tracemalloc.Filter(True, f"{PACKAGE_DIR}{os.sep}*", all_frames=True)
+        ]
+        stats = last.filter_traces(navbar).compare_to(
+            first.filter_traces(navbar), "traceback"
+        )
+        for stat in stats[:args.top]:
+            print(f"\n{stat.size_diff / added:,.0f} B per session")
+            for line in stat.traceback.format()[-8:]:
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Measure the bytes of the logo before and after the SVG optimization.
+
+For each SVG, the size of the file, of the optimized SVG and of both encoded
+in base64, as sent to the navbar on every rerun, are reported along with the
+time to optimize it. Without files, the logo of the examples and a synthetic
+SVG exported by an editor are measured.
+
+Usage: python benchmarks/svg_size.py [--budget BYTES] [FILE ...]
+
+Exits with status 1 if a budget is given and the optimized logo, encoded in
+base64, is over it.
+"""
+
+import argparse
+import base64
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_editor_svg(n_paths):
+    """Write an SVG like the ones exported by editors to a temporary file."""
+    rng = random.Random(0)
+    paths = []
+    for i in range(n_paths):
+        points = " ".join(
+            f"L{rng.uniform(0, 512):.6f},{rng.uniform(0, 512):.6f}"
+            for _ in range(12)
+        )
+        paths.append(
+            f'    <path inkscape:label="shape {i}" '
+            f'd="M{rng.uniform(0, 512):.6f},{rng.uniform(0, 512):.6f} '
+            f'{points} Z" fill="url(#gradient{i % 4})"/>\n'
+        )
+    gradients = "".join(
+        f'    <linearGradient id="gradient{i}">\n'
+        f'      <stop offset="0" stop-color="#{i}{i}{i}"/>\n'
+        f"    </linearGradient>\n"
+        for i in range(8)
+    )
+    svg = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+        "<!-- Created with Inkscape (http://www.inkscape.org/) -->\n"
+        '<svg xmlns="http://www.w3.org/2000/svg"\n'
+        '   xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"\n'
+        '   xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/'
+        'sodipodi-0.dtd"\n'
+        '   xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"\n'
+        '   viewBox="0 0 512 512" inkscape:version="1.3">\n'
+        '  <sodipodi:namedview id="namedview" inkscape:zoom="1.41"/>\n'
+        "  <metadata>\n    <rdf:RDF/>\n  </metadata>\n"
+        f"  <defs>\n{gradients}  </defs>\n"
+        f'  <g inkscape:groupmode="layer">\n{"".join(paths)}  </g>\n'
+        "</svg>\n"
+    )
+    fd, path = tempfile.mkstemp(prefix="editor_", suffix=".svg")
+    with os.fdopen(fd, "w") as file:
+        file.write(svg)
+    return path
+
+
+def measure(path):
+    """Get the sizes of an SVG and the time to optimize it, in ms."""
+    from streamlit_navigation_bar import svg
+
+    with open(path, "rb") as file:
+        source = file.read()
+    start = time.perf_counter()
+    optimized = svg.optimize_svg(source)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return {
+        "source": len(source),
+        "optimized": len(optimized),
+        "base64_source": len(base64.b64encode(source)),
+        "base64_optimized": len(base64.b64encode(optimized)),
+        "ms": elapsed_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("files", nargs="*", help="SVG files to measure")
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="maximum size of the optimized logo in base64, in bytes",
+    )
+    args = parser.parse_args()
+    sys.path.insert(0, ROOT)
+
+    files = args.files
+    generated = []
+    if not files:
+        generated.append(make_editor_svg(n_paths=600))
+        files = [
+            os.path.join(ROOT, "examples", "st_navbar_3", "cubes.svg"),
+            *generated,
+        ]
+
+    failures = []
+    print(
+        f"{'file':<24} {'source':>8} {'optimized':>9} {'base64':>8} "
+        f"{'-> base64':>9} {'saved':>6} {'ms':>7}"
+    )
+    for path in files:
+        sizes = measure(path)
+        saved = 1 - sizes["optimized"] / sizes["source"]
+        print(
+            f"{os.path.basename(path)[:24]:<24} {sizes['source']:>8} "
+            f"{sizes['optimized']:>9} {sizes['base64_source']:>8} "
+            f"{sizes['base64_optimized']:>9} {saved:>6.1%} "
+            f"{sizes['ms']:>7.2f}"
+        )
+        if args.budget is not None and sizes["base64_optimized"] > args.budget:
+            failures.append(
+                f"{path} takes {sizes['base64_optimized']} bytes, over the "
+                f"budget of {args.budget} bytes"
+            )
+
+    for path in generated:
+        os.remove(path)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
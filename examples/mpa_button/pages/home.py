@@ -1,12 +1,9 @@
 import streamlit as st
-
-
-def handle_click(page):
-    st.session_state["selected"] = page
+from streamlit_navigation_bar import set_page
 
 
 def home():
     # Home content goes here, for example:
     st.write("Foo")
-    st.button("Go to Page 1", on_click=handle_click, args=["Page 1"])
-    st.button("Go to Page 2", on_click=handle_click, args=["Page 2"])
+    st.button("Go to Page 1", on_click=set_page, args=["selected", "Page 1"])
+    st.button("Go to Page 2", on_click=set_page, args=["selected", "Page 2"])
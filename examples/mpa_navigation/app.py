@@ -0,0 +1,14 @@
+import streamlit as st
+from streamlit_navigation_bar import st_navbar
+
+import pages as pg
+
+
+st.set_page_config(initial_sidebar_state="collapsed")
+
+styles = {"div": {"max-width": "350px"}}  # Reduce the page names spacing.
+page = st_navbar(
+    {"Home": pg.home, "Page 1": pg.page_1, "Page 2": pg.page_2},
+    styles=styles,
+)
+page.run()
@@ -0,0 +1,3 @@
+from .home import home
+from .page_1 import page_1
+from .page_2 import page_2
@@ -0,0 +1,6 @@
+import streamlit as st
+
+
+def home():
+    # Home content goes here, for example:
+    st.write("Foo")
@@ -0,0 +1,6 @@
+import streamlit as st
+
+
+def page_1():
+    # Page 1 content goes here, for example:
+    st.write("Bar")
@@ -0,0 +1,6 @@
+import streamlit as st
+
+
+def page_2():
+    # Page 2 content goes here, for example:
+    st.write("Baz")
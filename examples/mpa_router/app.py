@@ -0,0 +1,16 @@
+import streamlit as st
+from streamlit_navigation_bar import Router, st_navbar
+
+
+st.set_page_config(initial_sidebar_state="collapsed")
+
+# Each page module is only imported when the page is first visited.
+router = Router({
+    "Home": "pages.home:home",
+    "Page 1": "pages.page_1:page_1",
+    "Page 2": "pages.page_2:page_2",
+})
+
+styles = {"div": {"max-width": "350px"}}  # Reduce the page names spacing.
+page = st_navbar(router.pages, styles=styles)
+router.run(page)
@@ -47,7 +47,7 @@ setup(
     ],
     include_package_data=True,
     package_data={
-        "streamlit_navigation_bar": ["templates/*.css"],
+        "streamlit_navigation_bar": ["templates/*.css", "templates/*.json"],
     },
     entry_points={
         "console_scripts": [
@@ -57,6 +57,9 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "streamlit >= 1.33.0",
-        "st-theme >= 1.2.3",
     ],
+    extras_require={
+        # Only needed to render CSS templates that are not precompiled.
+        "templates": ["jinja2"],
+    },
 )
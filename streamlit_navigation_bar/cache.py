@@ -0,0 +1,127 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache():
+    """
+    Represent a bounded, thread-safe, least recently used cache.
+
+    Streamlit runs the script of each session in its own thread, so a cache
+    shared at the module level is accessed concurrently. Every read and write
+    is guarded by a lock, and the number of hits, misses and evictions is
+    counted to make the cache behavior observable.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of entries kept in the cache. When it is exceeded,
+        the least recently used entry is evicted.
+    hits : int
+        The number of lookups that found a cached entry.
+    misses : int
+        The number of lookups that did not find a cached entry.
+    evictions : int
+        The number of entries removed to keep the cache within `maxsize`.
+
+    Methods
+    -------
+    get(key, default=None)
+        Get the value cached for a key.
+    put(key, value)
+        Cache a value for a key.
+    clear()
+        Remove all entries and reset the counters.
+    info()
+        Get the counters and the current size of the cache.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Instantiate an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int, default=128
+            The maximum number of entries kept in the cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """
+        Get the value cached for a key.
+
+        Parameters
+        ----------
+        key : hashable
+            The key associated with the cached value.
+        default : any, optional
+            The value to be returned in case the key is not cached. Defaults
+            to ``None``.
+
+        Returns
+        -------
+        value : any
+            The cached value, or `default` if the key is not cached.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Cache a value for a key.
+
+        Parameters
+        ----------
+        key : hashable
+            The key to associate with the value.
+        value : any
+            The value to be cached.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """
+        Get the counters and the current size of the cache.
+
+        Returns
+        -------
+        info : dict of {str : int}
+            A dictionary with the ``"hits"``, ``"misses"``, ``"evictions"``,
+            ``"size"`` and ``"maxsize"`` of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
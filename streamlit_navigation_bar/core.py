@@ -0,0 +1,1307 @@
+import os
+import sys
+import json
+import base64
+import hashlib
+import inspect
+import tempfile
+import threading
+import warnings
+from types import MappingProxyType
+
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+from streamlit_navigation_bar import (
+    _declare,
+    errors,
+    html_navbar,
+    match_navbar,
+    svg,
+    timing,
+)
+from streamlit_navigation_bar.cache import LRUCache
+from streamlit_navigation_bar.navigation import is_routed, navigate
+from streamlit_navigation_bar.match_navbar import (
+    get_config_theme,
+    match_ui,
+)
+from streamlit_navigation_bar.precompile import (
+    load_sheets,
+    options_id,
+    render_root,
+)
+from streamlit_navigation_bar.errors import (
+    _fingerprint,
+    check_callbacks,
+    check_html_callbacks,
+    check_key,
+    check_selected,
+    check_spec,
+    check_spec_args,
+)
+
+
+_RELEASE = False
+
+if not _RELEASE:
+    _st_navbar = _declare(
+        "st_navbar",
+        url="http://localhost:5173",
+    )
+else:
+    parent_dir = os.path.dirname(os.path.abspath(__file__))
+    build_dir = os.path.join(parent_dir, "frontend/dist")
+    _st_navbar = _declare(
+        "st_navbar",
+        path=build_dir,
+    )
+
+# Whether Streamlit runs the callback of a component before the script, as it
+# does with widgets. Otherwise, ``st_navbar`` runs it from the new value in
+# the session state, before placing the navbar.
+_NATIVE_CALLBACK = "on_change" in inspect.signature(
+    type(_st_navbar).__call__
+).parameters
+
+
+# The Jinja environments and rendered CSS are shared by all sessions.
+_envs = {}
+_envs_lock = threading.Lock()
+_css_cache = LRUCache(maxsize=256)
+
+# The logos are read and encoded once per path, modification time and size.
+_logo_cache = LRUCache(maxsize=32)
+
+# The specs built from the arguments of ``st_navbar``, shared by all sessions.
+_spec_cache = LRUCache(maxsize=64)
+
+# Directory registered as a component, only to serve the logos as assets. It
+# is kept for the life of the process and removed when it exits.
+_assets = {}
+_assets_lock = threading.Lock()
+
+
+def _logo_key(path):
+    """Identify the version of a logo by its path, modified time and size."""
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _read_svg(path, optimize):
+    """Read an SVG, optimized or not, from an absolute path."""
+    cache_key = ("svg", optimize) + _logo_key(path)
+    content = _logo_cache.get(cache_key)
+    if content is None:
+        with open(path, "rb") as file:
+            content = file.read()
+        if optimize:
+            content = svg.optimize_svg(content)
+        _logo_cache.put(cache_key, content)
+    return content
+
+
+def _encode_svg(path, optimize=False):
+    """Encode an SVG to base64, from an absolute path."""
+    cache_key = ("base64", optimize) + _logo_key(path)
+    base64_svg = _logo_cache.get(cache_key)
+    if base64_svg is None:
+        content = _read_svg(path, optimize)
+        base64_svg = base64.b64encode(content).decode("utf-8")
+        _logo_cache.put(cache_key, base64_svg)
+    return base64_svg
+
+
+def _check_logo_size(path, optimize, encoded_size, budget):
+    """
+    Report the size of the logo, and warn if it is over the budget.
+
+    The size of the SVG file, of the optimized SVG and of the logo as sent to
+    the browser are recorded by ``timing``, when it is enabled.
+    """
+    source_size = _logo_key(path)[2]
+    if timing.is_enabled():
+        timing.record("logo_source_bytes", source_size)
+        timing.record("logo_svg_bytes", len(_read_svg(path, optimize)))
+        timing.record("logo_bytes", encoded_size)
+    if budget is not None and encoded_size > budget:
+        hint = "" if optimize else " Pass optimize_logo=True to reduce it."
+        warnings.warn(
+            f"The logo at {path} takes {encoded_size} bytes, from an SVG "
+            f"of {source_size} bytes, which is over the budget of {budget} "
+            f"bytes.{hint}",
+            stacklevel=2,
+        )
+
+
+def _get_assets():
+    """Get the component that serves the logos, declaring it once."""
+    assets = _assets.get("component")
+    if assets is None:
+        with _assets_lock:
+            assets = _assets.get("component")
+            if assets is None:
+                directory = tempfile.TemporaryDirectory(prefix="st_navbar_")
+                assets = _declare("st_navbar_assets", path=directory.name)
+                _assets["directory"] = directory
+                _assets["component"] = assets
+    return assets
+
+
+def _serve_svg(path, optimize=False):
+    """
+    Serve an SVG as a static asset, from an absolute path.
+
+    The SVG is copied to a directory registered as a component, under a name
+    derived from its content. This way, Streamlit serves it with a stable URL
+    that can be cached by the browser, and only the URL is sent to the navbar
+    on each rerun.
+
+    Parameters
+    ----------
+    path : str
+        The absolute path to the SVG file.
+    optimize : bool, default=False
+        Whether the SVG is optimized before it is served.
+
+    Returns
+    -------
+    url : str or None
+        The URL path of the SVG, relative to the root of the server. If the
+        SVG could not be copied, returns ``None``.
+    """
+    cache_key = ("asset", optimize) + _logo_key(path)
+    filename = _logo_cache.get(cache_key)
+    if filename is None:
+        content = _read_svg(path, optimize)
+        filename = hashlib.sha256(content).hexdigest()[:16] + ".svg"
+        assets = _get_assets()
+        asset_path = os.path.join(assets.path, filename)
+        try:
+            if not os.path.exists(asset_path):
+                # Write to a temporary file first, as sessions run in
+                # parallel and may be copying the same SVG.
+                fd, tmp_path = tempfile.mkstemp(dir=assets.path)
+                with os.fdopen(fd, "wb") as file:
+                    file.write(content)
+                os.replace(tmp_path, asset_path)
+        except OSError:
+            return None
+        _logo_cache.put(cache_key, filename)
+
+    base_url_path = st.get_option("server.baseUrlPath").strip("/")
+    parts = [base_url_path, "component", _get_assets().name, filename]
+    return "/" + "/".join(part for part in parts if part)
+
+
+# The href and target of the pages without an URL, shared by all of them.
+_internal_url = ("#", "_self")
+
+
+def _prepare_urls(urls, pages):
+    """Build dict with given hrefs, targets and defaults where omitted."""
+    if urls is None:
+        urls = {}
+    prepared = {}
+    for page in pages:
+        # Add {page: (href, target)} to the `prepared` dict.
+        if page in urls:
+            prepared[page] = (urls[page], "_blank")
+        else:
+            prepared[page] = _internal_url
+    return prepared
+
+
+# The selectors of the stylesheet that applies `styles` to the navbar, in the
+# order their rules are written. The id gives them precedence over the default
+# style of the navbar, and "hover" comes last to take precedence over
+# "active".
+_selectors = {
+    "nav": "#navbar",
+    "div": "#navbar .navbar-div",
+    "ul": "#navbar .navbar-ul",
+    "li": "#navbar .navbar-li",
+    "a": "#navbar .navbar-a",
+    "img": "#navbar .navbar-img",
+    "span": "#navbar .navbar-span",
+    "active": "#navbar .navbar-span.active",
+    "hover": "#navbar .navbar-span:hover",
+}
+
+
+def _compile_styles(styles):
+    """Build a stylesheet with a rule for each target in `styles`."""
+    if not styles:
+        return ""
+    rules = []
+    for target, selector in _selectors.items():
+        style = styles.get(target)
+        if style:
+            declarations = "".join(
+                f"{css_property}:{value};"
+                for css_property, value in style.items()
+            )
+            rules.append(f"{selector}{{{declarations}}}")
+    return "\n".join(rules)
+
+
+def _prepare_options(options):
+    """Build dict with given options, state and defaults where omitted."""
+    available = {
+        "show_menu": True,
+        "show_sidebar": True,
+        "hide_nav": True,
+        "fix_shadow": True,
+        "use_padding": True,
+        # Opt-in, since it changes how the navbar is laid out.
+        "use_overflow": False,
+    }
+    for option in available:
+        if isinstance(options, dict) and option in options:
+            available[option] = options[option]
+        elif isinstance(options, bool) and not options:
+            available[option] = options
+    return available
+
+
+def get_path(directory):
+    """Get the abs path for a directory in the same location as this file."""
+    parent_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(parent_dir, directory)
+
+
+def load_env(path):
+    """Load the Jinja environment from a given absolute path."""
+    try:
+        from jinja2 import FileSystemLoader, Environment
+    except ImportError as exc:
+        raise ImportError(
+            "Jinja is required to render CSS templates that are not "
+            "precompiled. Install it with `pip install jinja2`."
+        ) from exc
+
+    loader = FileSystemLoader(path)
+    return Environment(
+        loader=loader,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+    )
+
+
+def _get_env(path):
+    """Get the Jinja environment for a path, loading it once per process."""
+    env = _envs.get(path)
+    if env is None:
+        with _envs_lock:
+            env = _envs.get(path)
+            if env is None:
+                env = load_env(path)
+                _envs[path] = env
+    return env
+
+
+def _render_css(ui, options, key, path):
+    """
+    Render the CSS adjustments, reusing a previous render if possible.
+
+    The sheet precompiled for the options is used when there is one, with the
+    values of the UI set as custom properties. Otherwise, the templates are
+    rendered with Jinja.
+    """
+    cache_key = (ui.astuple(), tuple(options.items()), key, path)
+    css = _css_cache.get(cache_key)
+    if css is None:
+        sheets = load_sheets(path)
+        if sheets is not None:
+            css = render_root(ui) + sheets[options_id(options)]
+        else:
+            margin = options["show_menu"] or options["show_sidebar"]
+            template = _get_env(path).get_template("options.css")
+            css = template.render(
+                ui=ui,
+                options=options,
+                margin=margin,
+                key=key,
+            )
+        _css_cache.put(cache_key, css)
+    return css
+
+
+def cache_info():
+    """
+    Get the counters of the caches shared by all sessions in the process.
+
+    Returns
+    -------
+    info : dict of {str : dict of {str : int}}
+        A dictionary with the cache name as the key and another dictionary
+        with its ``"hits"``, ``"misses"``, ``"evictions"``, ``"size"`` and
+        ``"maxsize"`` as the value.
+    """
+    return {
+        "args": errors._validated.info(),
+        "css": _css_cache.info(),
+        "logo": _logo_cache.info(),
+        "spec": _spec_cache.info(),
+        "svg": svg._optimized.info(),
+        "ui": match_navbar._ui_cache.info(),
+    }
+
+
+def _emit_css(css, key, use_padding, content=""):
+    """
+    Apply the CSS adjustments and position the body with a single element.
+
+    The element is an ``st.html`` with the CSS adjustments, the `content` and
+    an empty span, whose unique class identifies it. Streamlit hides an
+    ``st.html`` without height, so the position of the body is adjusted by
+    the margin-top of the element that follows it, which also compensates for
+    the gap that is no longer between them. The content of the element only
+    depends on its arguments, so it is the same on every rerun where they do
+    not change.
+
+    Parameters
+    ----------
+    css : str
+        The CSS adjustments.
+    key : str
+        A class unique to the navbar, to identify the element.
+    use_padding : bool
+        Whether the body is positioned 6rem from the top (``True``), like
+        Streamlit's default, or right below the navbar (``False``).
+    content : str, default=""
+        The HTML placed in the element, e.g. the navbar rendered with
+        ``html=True``.
+    """
+    if use_padding:
+        margin_top = "-3.875rem"
+    else:
+        margin_top = "-7rem"
+
+    st.html(
+        "<style>"
+        'div[data-testid="element-container"]:has('
+        f"> div.stHtml > span.{key}) + div {{"
+        f"margin-top: {margin_top};"
+        "}\n"
+        + css
+        + f"</style>{content}<span class='{key}'></span>"
+    )
+
+
+def _place_html(spec, default, key):
+    """
+    Place a navbar rendered with ``st.html`` and get the page selected.
+
+    The page is read from the query parameter of the navbar and goes through
+    the session state like the value of the component, so that a page set
+    with ``set_page`` takes precedence. It is then written back to the URL.
+    The navbar and its CSS are placed in a single element.
+    """
+    param = html_navbar.page_param(key)
+    logo_page = spec.logo_page if spec.logo_path is not None else None
+    query_page = html_navbar.read_page(param, spec._page_set, logo_page)
+    if query_page is None:
+        query_page = default
+    page, _ = _read_value({"page": query_page, "theme": None}, default, key)
+    if page is not None and page != query_page:
+        html_navbar.write_page(param, page)
+
+    with timing.phase("render_html"):
+        nav = html_navbar.render_navbar(spec._args, page, param)
+    with timing.phase("emit_css"):
+        if spec.adjust:
+            _emit_css(
+                spec.css + "\n" + spec._html_css,
+                f"st_navbar_key_{key}",
+                spec.options["use_padding"],
+                content=nav,
+            )
+        else:
+            st.html(f"<style>{spec._html_css}</style>{nav}")
+    return page
+
+
+def adjust_css(styles, options, key, path, theme=None):
+    """
+    Apply CSS adjustments to display the navbar correctly.
+
+    By default, Streamlit limits the position of components in the web app to
+    a certain width and adds a padding to the top. This function renders Jinja
+    templates to adjust the CSS and display the navbar at the full width at the
+    top of the window, among other options that can be toggled on or off.
+
+    It also matches the style, theme and configuration between the navbar and 
+    Streamlit's User Interface (UI) elements, to make them look seamless.
+
+    Parameters
+    ----------
+    styles : dict of {str : dict of {str : str}}
+        Apply CSS styles to desired targets, through a dictionary with the HTML
+        tag or pseudo-class name as the key and another dictionary to style it
+        as the value. In the second dictionary, the key-value pair is the name
+        of a CSS property and the value it takes, both in string format. It
+        accepts CSS variables to be passed as values.
+
+        The available HTML tags are: ``"nav"``, ``"div"``, ``"ul"``, ``"li"``,
+        ``"a"``, ``"img"`` and ``"span"``.
+
+        The available pseudo-classes are: ``"active"`` and ``"hover"``, which
+        direct the styling to the ``"span"`` tag. The menu and sidebar buttons
+        are only styled by the ``"color"`` and ``"background-color"`` of
+        ``"hover"`` (if they are set to ``True`` in `options`).
+    options : bool or dict of {str : bool}
+        Customize the navbar with options that can be toggled on or off. It
+        accepts a dictionary with the option name as the key and a boolean as
+        the value. The available options are: ``"show_menu"``,
+        ``"show_sidebar"``, ``"hide_nav"``, ``"fix_shadow"``,
+        ``"use_padding"`` and ``"use_overflow"``.
+
+        It is also possible to toggle all options to the same state. Simply
+        pass ``True`` or ``False`` to `options`.
+    key : str, int or None
+        A key associated with the element that adjusts the CSS. This needs to
+        be unique since the position of the body is adjusted after the element
+        with this key.
+    path : str
+        The absolute path to the directory containing the Jinja templates with
+        the CSS adjustments.
+    theme : dict of {str : str}, optional
+        A dictionary with the name of the theme variable as the key and its
+        value. Defaults to ``None``, where the theme defined by the
+        configuration options is used.
+    """
+    with timing.phase("match_theme"):
+        if theme is None:
+            theme = get_config_theme()
+        ui = match_ui(styles, theme)
+
+    options = _prepare_options(options)
+    key = f"st_navbar_key_{key}"
+
+    with timing.phase("render_css"):
+        css = _render_css(ui, options, key, path)
+    with timing.phase("emit_css"):
+        _emit_css(css, key, options["use_padding"])
+
+
+class _NavbarState():
+    """
+    Remember the last value and page of a navbar in a session.
+
+    A navbar keeps one of these in the session state, which is updated in
+    place on each rerun. The value is the same object held by Streamlit as
+    the state of the component, and the page is interned, so nothing is
+    copied.
+    """
+
+    __slots__ = ("value", "page")
+
+    def __init__(self, value, page):
+        self.value = value
+        self.page = page
+
+
+def _read_value(value, default, key):
+    """
+    Get the selected page and the theme from the value of the navbar.
+
+    The navbar returns a dictionary with the page selected by the user and the
+    theme active in the frontend, when it differs from the one defined by the
+    configuration options. Before any interaction, there is no value and the
+    page is the default one.
+
+    When there is a key, the page is also kept in the session state under it,
+    like the value of a widget. And, as with widgets, a page set in the
+    session state by the user takes precedence until the navbar returns a new
+    value.
+
+    Parameters
+    ----------
+    value : dict or any
+        The value returned by the navbar component.
+    default : str or None
+        The page to be returned when there has been no interaction yet.
+    key : str, int or None
+        The key of the navbar, under which the page is kept in the session
+        state.
+
+    Returns
+    -------
+    page : str or None
+        The page selected by the user, set in the session state or the default.
+    theme : dict of {str : str} or None
+        The theme active in the frontend, or ``None`` if it is the one defined
+        by the configuration options.
+    """
+    if not isinstance(value, dict):
+        value = {"page": default, "theme": None}
+    page = value.get("page")
+    theme = value.get("theme")
+    if isinstance(page, str):
+        # The page is decoded anew in each session, so it is interned to be
+        # shared by all of them.
+        page = sys.intern(page)
+
+    if key is None:
+        return page, theme
+    if value.get("intent") is not None:
+        # The intent to select a page is not a selection, so a value that
+        # only reports a new one is not a new value.
+        value = dict(value, intent=None)
+
+    session_state = st.session_state
+    states = session_state.setdefault("_st_navbar", {})
+    state = states.get(key)
+    if key in session_state and (
+        state is None or session_state[key] != state.page
+    ):
+        # The page was set in the session state by the user.
+        page = session_state[key]
+    elif state is not None and value == state.value:
+        # The navbar did not return a new value since the last run.
+        page = state.page
+
+    if state is None:
+        states[key] = _NavbarState(value, page)
+    else:
+        state.value = value
+        state.page = page
+    session_state[key] = page
+    return page, theme
+
+
+def _track_value(component_key, value, page):
+    """
+    Record the value and the page of a navbar, and check what changed.
+
+    Returns
+    -------
+    changed : bool
+        Whether the navbar returned a new value that selects another page
+        than the one recorded last. A page set in the session state, without
+        a new value, is not a change.
+    intent : str or None
+        The page the user showed the intent to select, if it is a new one.
+    """
+    changes = st.session_state.setdefault("_st_navbar_changes", {})
+    last = changes.get(component_key)
+    if last is None:
+        changes[component_key] = _NavbarState(value, page)
+        return False, None
+
+    changed = value != last.value and page != last.page
+    intent = value.get("intent") if isinstance(value, dict) else None
+    last_intent = None
+    if isinstance(last.value, dict):
+        last_intent = last.value.get("intent")
+    if intent == last_intent:
+        intent = None
+    last.value = value
+    last.page = page
+    return changed, intent
+
+
+def _run_callbacks(changed, intent, on_change, args, kwargs, on_prefetch):
+    """Run the callbacks of a navbar for what changed in its value."""
+    if intent is not None and on_prefetch is not None:
+        on_prefetch(intent)
+    if changed and on_change is not None:
+        on_change(*(args or ()), **(kwargs or {}))
+
+
+def _make_callback(
+    component_key,
+    default,
+    key,
+    on_change,
+    args,
+    kwargs,
+    on_prefetch,
+):
+    """
+    Wrap the callbacks of a navbar, to be run by Streamlit before the script.
+
+    The page is read from the new value, and set in the session state under
+    `key`, so `on_change` sees it there, like with widgets. It is only run
+    when the page changes, not when the theme does, and `on_prefetch` only
+    when the intent to select a page does.
+    """
+    def callback():
+        value = st.session_state[component_key]
+        page, _ = _read_value(value, default, key)
+        changed, intent = _track_value(component_key, value, page)
+        _run_callbacks(changed, intent, on_change, args, kwargs, on_prefetch)
+
+    return callback
+
+
+def set_page(key, page):
+    """
+    Select a page of the navbar with the given key.
+
+    The page is set in the session state under the key, so ``st_navbar``
+    returns it and the navbar highlights it. When called from a callback,
+    e.g. from ``st.button`` or from the `on_change` of ``st_navbar``, which
+    run before the script, it takes effect in the same rerun.
+
+    Parameters
+    ----------
+    key : str or int
+        The key given to ``st_navbar``.
+    page : str or None
+        The name of the page to select, or ``None`` to select none.
+    """
+    if key is None:
+        raise StreamlitAPIException(
+            "set_page() needs the key given to st_navbar(), but got None."
+        )
+    check_key(key)
+    st.session_state[key] = page
+
+
+class NavbarSpec():
+    """
+    Represent an immutable, prebuilt specification of a navigation bar.
+
+    A spec holds everything about the navbar that does not change between
+    reruns, already checked and prepared: the pages, the encoded logo, the
+    URLs, the styles, the options and the CSS adjustments rendered for the
+    theme defined by the configuration options. It is hashable and can be
+    shared between sessions, e.g. with ``st.cache_resource``, so that
+    ``st_navbar`` only has to place it in the app. Its mappings are read-only
+    views, and it can be copied and pickled.
+
+    It must be built with `NavbarSpec.build`. The logo is read when the spec
+    is built, so changes to its file afterwards are not reflected.
+
+    Attributes
+    ----------
+    pages : tuple of str
+        The name of each page displayed in the navbar.
+    logo_path : str or None
+        The absolute path to the SVG file of the logo, if there is one.
+    logo_page : str or None
+        The page value returned when the logo is selected.
+    urls : mappingproxy of {str : tuple of str}
+        The href and target of each page.
+    styles : mappingproxy of {str : mappingproxy of {str : str}} or None
+        The CSS styles applied to the targets of the navbar.
+    options : mappingproxy of {str : bool}
+        The state of each option.
+    adjust : bool
+        Whether the CSS adjustments are made.
+    html : bool
+        Whether the navbar is rendered into the page with ``st.html``,
+        instead of a component.
+    css : str or None
+        The CSS adjustments, rendered for the theme defined by the
+        configuration options, or ``None`` if `adjust` is ``False``.
+    digest : str
+        A hash of the content of the spec, which identifies it.
+
+    Methods
+    -------
+    build(pages, logo_path=None, logo_page="Home", urls=None, styles=None,
+          options=True, adjust=True, serve_logo=False, optimize_logo=False,
+          logo_budget=None, html=False)
+        Check and prepare the arguments of a navbar into a spec.
+    """
+
+    __slots__ = (
+        "pages",
+        "logo_path",
+        "logo_page",
+        "urls",
+        "styles",
+        "options",
+        "adjust",
+        "html",
+        "css",
+        "digest",
+        "_page_set",
+        "_default",
+        "_args",
+        "_config_theme",
+        "_html_css",
+    )
+
+    # The attributes that are mappings, which are read-only views.
+    _mappings = ("urls", "styles", "options", "_args")
+
+    def __init__(self, **attributes):
+        styles = attributes["styles"]
+        if styles is not None:
+            attributes["styles"] = {
+                target: MappingProxyType(style)
+                for target, style in styles.items()
+            }
+        for name in self._mappings:
+            if attributes[name] is not None:
+                attributes[name] = MappingProxyType(attributes[name])
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        # The read-only views cannot be pickled, so the spec is rebuilt from
+        # a copy of its attributes.
+        attributes = {name: getattr(self, name) for name in self.__slots__}
+        for name in self._mappings:
+            if attributes[name] is not None:
+                attributes[name] = dict(attributes[name])
+        if attributes["styles"] is not None:
+            attributes["styles"] = {
+                target: dict(style)
+                for target, style in attributes["styles"].items()
+            }
+        return (_restore_spec, (attributes,))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("A NavbarSpec cannot be modified.")
+
+    def __delattr__(self, name):
+        raise AttributeError("A NavbarSpec cannot be modified.")
+
+    def __hash__(self):
+        return hash(self.digest)
+
+    def __eq__(self, other):
+        if not isinstance(other, NavbarSpec):
+            return NotImplemented
+        return self.digest == other.digest
+
+    def __repr__(self):
+        return f"NavbarSpec(pages={list(self.pages)!r}, digest={self.digest!r})"
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @classmethod
+    def build(
+        cls,
+        pages,
+        logo_path=None,
+        logo_page="Home",
+        urls=None,
+        styles=None,
+        options=True,
+        adjust=True,
+        serve_logo=False,
+        optimize_logo=False,
+        logo_budget=None,
+        html=False,
+    ):
+        """
+        Check and prepare the arguments of a navbar into a spec.
+
+        The parameters are the same ones from ``st_navbar``, except for
+        `selected`, `key` and the callbacks, which are given to
+        ``st_navbar`` along with the spec.
+
+        Returns
+        -------
+        spec : NavbarSpec
+            The immutable specification of the navbar.
+        """
+        with timing.phase("validate"):
+            check_spec(
+                pages,
+                logo_path,
+                logo_page,
+                urls,
+                styles,
+                options,
+                adjust,
+                serve_logo,
+                optimize_logo,
+                logo_budget,
+                html,
+            )
+
+        base64_svg = None
+        logo_url = None
+        if logo_path is not None:
+            with timing.phase("encode_logo"):
+                if serve_logo:
+                    logo_url = _serve_svg(logo_path, optimize_logo)
+                if logo_url is None:
+                    base64_svg = _encode_svg(logo_path, optimize_logo)
+                    encoded_size = len(base64_svg)
+                else:
+                    encoded_size = len(_read_svg(logo_path, optimize_logo))
+            _check_logo_size(
+                logo_path, optimize_logo, encoded_size, logo_budget
+            )
+
+        if logo_path is not None:
+            default = logo_page
+        else:
+            default = pages[0]
+
+        with timing.phase("prepare"):
+            urls = _prepare_urls(urls, pages)
+            if styles is not None:
+                styles = {
+                    target: dict(style) for target, style in styles.items()
+                }
+            options = _prepare_options(options)
+
+            # The arguments of the component that are the same on every
+            # rerun.
+            args = {
+                "pages": list(pages),
+                "base64_svg": base64_svg,
+                "logo_url": logo_url,
+                "logo_page": logo_page,
+                "urls": urls,
+                "stylesheet": _compile_styles(styles),
+                "overflow": options["use_overflow"],
+            }
+        content = json.dumps([args, options, adjust, html], sort_keys=True)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        css = None
+        config_theme = None
+        html_css = None
+        if adjust or html:
+            with timing.phase("match_theme"):
+                config_theme = get_config_theme()
+                ui = match_ui(styles, config_theme)
+        if adjust:
+            with timing.phase("render_css"):
+                css = _render_css(ui, options, None, get_path("templates"))
+        if html:
+            html_css = html_navbar.build_stylesheet(
+                ui, options, adjust, args["stylesheet"]
+            )
+
+        return cls(
+            pages=tuple(pages),
+            logo_path=logo_path,
+            logo_page=logo_page,
+            urls=urls,
+            styles=styles,
+            options=options,
+            adjust=adjust,
+            html=html,
+            css=css,
+            digest=digest,
+            _page_set=frozenset(pages),
+            _default=default,
+            _args=args,
+            _config_theme=config_theme,
+            _html_css=html_css,
+        )
+
+
+def _restore_spec(attributes):
+    """Restore a NavbarSpec from its attributes, e.g. when unpickled."""
+    return NavbarSpec(**attributes)
+
+
+def _get_spec(pages, **spec_args):
+    """
+    Get the spec of a navbar from the arguments of ``st_navbar``.
+
+    The spec is built once and shared for the same arguments, version of the
+    logo and theme defined by the configuration options, so that a rerun
+    does not check, encode and hash them again.
+    """
+    logo_path = spec_args["logo_path"]
+    try:
+        fingerprint = _fingerprint(pages, **spec_args)
+        logo = None if logo_path is None else _logo_key(logo_path)
+    except (TypeError, AttributeError, OSError):
+        # Let the spec be built, which raises the proper error.
+        return NavbarSpec.build(pages, **spec_args)
+
+    config_theme = None
+    if spec_args["adjust"] or spec_args["html"]:
+        config_theme = tuple(get_config_theme().items())
+    cache_key = (fingerprint, logo, config_theme)
+    spec = _spec_cache.get(cache_key)
+    if spec is None:
+        spec = NavbarSpec.build(pages, **spec_args)
+        _spec_cache.put(cache_key, spec)
+    return spec
+
+
+# A placeholder object to implement the default rules for `selected`.
+sentinel = object()
+
+
+@timing.timed("st_navbar")
+def st_navbar(
+    pages,
+    selected=sentinel,
+    logo_path=None,
+    logo_page="Home",
+    urls=None,
+    styles=None,
+    options=True,
+    adjust=True,
+    key=None,
+    serve_logo=False,
+    optimize_logo=False,
+    logo_budget=None,
+    html=False,
+    on_change=None,
+    args=None,
+    kwargs=None,
+    on_prefetch=None,
+):
+    """
+    Place a navigation bar in your Streamlit app.
+    
+    If there is no ``st.set_page_config`` command on the app page,
+    ``st_navbar`` must be the first Streamlit command used, and must only be
+    set once per page. If there is a ``st.set_page_config`` command, then
+    ``st_navbar`` must be the second one, right after it.
+
+    Parameters
+    ----------
+    pages : list of str, NavbarSpec, list of st.Page or dict
+        A list with the name of each page that will be displayed in the
+        navigation bar. It also accepts a spec, prebuilt with
+        ``NavbarSpec.build`` from the same parameters as this function, in
+        which case only `selected` and `key` can be given here. This way, the
+        navbar is checked and prepared once, instead of on every rerun.
+
+        With Streamlit 1.36.0 or later, it also accepts a list of ``st.Page``
+        objects, or a dictionary with the name of each page as the key and
+        an ``st.Page``, a function or the path to a Python file as the value.
+        The pages are then routed with ``st.navigation``: the page is selected
+        by the URL, and clicking another one switches to it with
+        ``st.switch_page``. In this case, `selected` cannot be given, and the
+        current page is returned, to be run with its ``run`` method.
+    selected : str or None, optional
+        The preselected page on first render. It can be a name from `pages`,
+        the `logo_page` (when there is a logo) or ``None``. Defaults to the
+        `logo_page` value, if there is a logo. In case there is not one,
+        defaults to the first page of the `pages` list. When set to ``None``,
+        it will initialize empty and return ``None`` until the user selects a
+        page.
+    logo_path : str, optional
+        The absolute path to an SVG file for a logo. It will be shown on the
+        left side of the navigation bar. Defaults to ``None``, where no logo is
+        displayed.
+    logo_page : str or None, default="Home"
+        The page value that will be returned when the logo is selected, if
+        there is one. Defaults to ``"Home"``. For a non-clickable logo, set
+        this to ``None``.
+    urls : dict of {str : str}, optional
+        A dictionary with the page name as the key and an external URL as the
+        value, both as strings. The page name must be contained in the `pages`
+        list. The URL will open in a new window or tab. The default is
+        ``None``.
+    styles : dict of {str : dict of {str : str}}, optional
+        Apply CSS styles to desired targets, through a dictionary with the HTML
+        tag or pseudo-class name as the key and another dictionary to style it
+        as the value. In the second dictionary, the key-value pair is the name
+        of a CSS property and the value it takes, both in string format. It
+        accepts CSS variables to be passed as values. Defaults to ``None``,
+        where just the default style is applied.
+
+        The available HTML tags are: ``"nav"``, ``"div"``, ``"ul"``, ``"li"``,
+        ``"a"``, ``"img"`` and ``"span"``.
+
+        The available pseudo-classes are: ``"active"`` and ``"hover"``, which
+        direct the styling to the ``"span"`` tag. The menu and sidebar buttons
+        are only styled by the ``"color"`` and ``"background-color"`` of
+        ``"hover"`` (if they are set to ``True`` in `options`).
+
+        To understand the Document Object Model from the navbar, the CSS
+        variables and the default style, go to the API reference in the Notes
+        section.
+    options : bool or dict of {str : bool}, default=True
+        Customize the navbar with options that can be toggled on or off. It
+        accepts a dictionary with the option name as the key and a boolean as
+        the value. The available options are: ``"show_menu"``,
+        ``"show_sidebar"``, ``"hide_nav"``, ``"fix_shadow"``,
+        ``"use_padding"`` and ``"use_overflow"``. Check the API reference in
+        the Notes section for a description of each one.
+
+        With ``"use_overflow"``, the pages that do not fit in the width of the
+        navbar are collapsed into a "More" dropdown menu, which only renders
+        the pages in view while it is open. The page returned is the same,
+        whether it was selected from the navbar or from the menu. It is off
+        unless set to ``True`` in the dictionary.
+
+        It is also possible to toggle all options to the same state. Simply
+        pass ``True`` to `options`, which is the parameter default value, or
+        ``False``. Passing ``True`` does not turn on ``"use_overflow"``.
+    adjust : bool, default=True
+        When set to ``True`` (default), it overrides some Streamlit behaviors
+        and makes a series of CSS adjustments to display the navbar correctly.
+
+        In most cases, the CSS adjustments do not interfere with the rest of
+        the web app, however there could be some situations where this occurs.
+        If this happens, or it is desired to disable all of them, pass
+        ``False`` to `adjust` and, when necessary, make your own CSS
+        adjustments with ``st.html``.
+
+        If set to ``False``, it will also disable all adjustments made by
+        `options`, regardless of whether they are on or off.
+    key : str or int, optional
+        A string or integer to use as a unique key for the component. If this
+        is omitted, a key will be generated for the widget based on its
+        content. Multiple navbars of the same type may not share the same key.
+    serve_logo : bool, default=False
+        When set to ``True``, the logo is served by Streamlit as a static
+        asset, with a URL derived from its content, instead of being encoded
+        in base64 and sent to the navbar on every rerun. This way, the browser
+        caches the logo and only its URL is sent. If the logo cannot be
+        served, it falls back to the base64 encoding.
+    optimize_logo : bool, default=False
+        When set to ``True``, the SVG of the logo is optimized before it is
+        sent: comments, metadata, editor data, whitespace and unused
+        definitions are removed, and the numbers are rounded to 3 decimals.
+        The optimized SVG is cached by its content.
+    logo_budget : int, optional
+        The maximum size of the logo, in bytes, as sent to the browser, i.e.
+        encoded in base64 or served as a file. A warning is issued when the
+        logo is over it. Defaults to ``None``, where there is no budget.
+    html : bool, default=False
+        When set to ``True``, the navbar is rendered straight into the page
+        with ``st.html``, instead of in the iframe of a component, which
+        saves the load of a document and its JavaScript before it shows.
+        Each page is then a link that carries the page in the query
+        parameter ``page``, or the one named after `key`, and the page
+        returned is read from it. A click loads the app again, in a new
+        session, so the callbacks are not available. Without JavaScript,
+        the pages that do not fit in the navbar are scrolled to instead of
+        collapsed into the "More" menu, and the theme is the one defined by
+        the configuration options. Links to external URLs may open in the
+        same tab.
+    on_change : callable, optional
+        An optional callback invoked when the user selects another page in
+        the navbar. As with widgets, it runs before the rest of the script,
+        with the new page already in the session state under `key`, so the
+        routing logic can be done there, or another page selected with
+        ``set_page``, in a single rerun.
+    args : tuple or list, optional
+        An optional tuple of args to pass to the callback.
+    kwargs : dict, optional
+        An optional dict of kwargs to pass to the callback.
+    on_prefetch : callable, optional
+        An optional callback invoked with the name of a page, when the user
+        hovers or focuses it for a moment, before selecting it. This is not a
+        selection, and the page returned does not change. It can be used to
+        warm up the caches of the page likely to be selected next, e.g. in a
+        background thread. Each intent reported reruns the whole app, like a
+        selection does, so the app should be cheap to rerun when it is given.
+        The intent is reported at most once per page until another page is
+        selected, and never while a rerun is in flight. Defaults to ``None``,
+        where the navbar does not report it.
+
+    Returns
+    -------
+    page : str, None or st.Page
+        The page selected by the user. If there has been no interaction yet,
+        returns the preselected page or ``None``. When the pages are routed
+        with ``st.navigation``, returns the current ``st.Page`` instead.
+
+    Notes
+    -----
+    To learn more about how to use the navbar, check the API reference
+    available at:
+
+    https://github.com/gabrieltempass/streamlit-navigation-bar/wiki/API-reference
+    
+    Examples
+    --------
+    >>> import streamlit as st
+    >>> from streamlit_navigation_bar import st_navbar
+    >>> page = st_navbar(
+    ...     ["Home", "Documentation", "Examples", "Community", "About"]
+    ... )
+    >>> st.write(page)
+
+    .. output::
+       https://st-navbar-1.streamlit.app/
+       height: 300px
+    """
+    if is_routed(pages):
+        return navigate(
+            pages,
+            selected is not sentinel,
+            key,
+            st_navbar,
+            logo_path=logo_path,
+            logo_page=logo_page,
+            urls=urls,
+            styles=styles,
+            options=options,
+            adjust=adjust,
+            serve_logo=serve_logo,
+            optimize_logo=optimize_logo,
+            logo_budget=logo_budget,
+            html=html,
+            on_change=on_change,
+            args=args,
+            kwargs=kwargs,
+            on_prefetch=on_prefetch,
+        )
+
+    if isinstance(pages, NavbarSpec):
+        spec = pages
+        with timing.phase("validate_call"):
+            check_spec_args(
+                logo_path=(logo_path, None),
+                logo_page=(logo_page, "Home"),
+                urls=(urls, None),
+                styles=(styles, None),
+                options=(options, True),
+                adjust=(adjust, True),
+                serve_logo=(serve_logo, False),
+                optimize_logo=(optimize_logo, False),
+                logo_budget=(logo_budget, None),
+                html=(html, False),
+            )
+    else:
+        spec = _get_spec(
+            pages,
+            logo_path=logo_path,
+            logo_page=logo_page,
+            urls=urls,
+            styles=styles,
+            options=options,
+            adjust=adjust,
+            serve_logo=serve_logo,
+            optimize_logo=optimize_logo,
+            logo_budget=logo_budget,
+            html=html,
+        )
+    with timing.phase("validate_call"):
+        check_selected(
+            selected,
+            spec.logo_page,
+            spec.logo_path,
+            spec.pages,
+            spec._page_set,
+        )
+        check_key(key)
+        check_callbacks(on_change, args, kwargs, on_prefetch)
+        check_html_callbacks(spec.html, on_change, on_prefetch)
+
+    if selected is sentinel:
+        default = spec._default
+    else:
+        default = selected
+    if spec.html:
+        return _place_html(spec, default, key)
+
+    # The navbar reports the theme active in the frontend only when it
+    # differs from the one defined by the configuration options.
+    config_theme = None
+    if spec.adjust:
+        with timing.phase("match_theme"):
+            config_theme = get_config_theme()
+
+    # The key of the component is different from the one given, so that the
+    # session state under `key` holds only the selected page. Without a key,
+    # it is derived from the content, as Streamlit would do.
+    if key is None:
+        identity = f"{spec.digest}{default!r}".encode("utf-8")
+        component_key = f"st_navbar_{hashlib.md5(identity).hexdigest()}"
+    else:
+        component_key = f"st_navbar_{key}"
+
+    # The value of the navbar is already in the session state. Without
+    # native callbacks, they are run before the navbar is placed, so that a
+    # page they set is highlighted in the same rerun.
+    held = st.session_state.get(component_key)
+    if not _NATIVE_CALLBACK:
+        page, theme = _read_value(held, default, key)
+        if on_change is not None or on_prefetch is not None:
+            changed, intent = _track_value(component_key, held, page)
+            _run_callbacks(
+                changed, intent, on_change, args, kwargs, on_prefetch
+            )
+            if changed and on_change is not None:
+                page, theme = _read_value(held, default, key)
+
+    # The navbar highlights the page held in the session state, which may
+    # have been set by the user, e.g. with ``set_page``.
+    active = default
+    if key is not None:
+        active = st.session_state.get(key, default)
+
+    # The navbar holds the arguments that do not change of the version it
+    # returns, or else of the last version sent to it, so only the version is
+    # sent instead. Unless it returns that it holds none, e.g. when its
+    # iframe was mounted again with an empty cache, and that report was not
+    # answered yet.
+    sent = st.session_state.setdefault("_st_navbar_sent", {})
+    last = sent.get(component_key)
+    if isinstance(held, dict) and held.get("version") == spec.digest:
+        static_args = {}
+    elif isinstance(held, dict) and held.get("version") is None:
+        if last is not None and last[0] == spec.digest and last[1] is held:
+            static_args = {}
+        else:
+            static_args = spec._args
+            sent[component_key] = (spec.digest, held)
+    elif last is not None and last[0] == spec.digest:
+        static_args = {}
+    else:
+        static_args = spec._args
+        sent[component_key] = (spec.digest, None)
+
+    component_args = dict(
+        static_args,
+        version=spec.digest,
+        default=active,
+        theme=config_theme,
+        prefetch=on_prefetch is not None,
+    )
+    if timing.is_enabled():
+        timing.record(
+            "args_bytes", len(json.dumps(component_args).encode("utf-8"))
+        )
+    with timing.phase("component"):
+        if _NATIVE_CALLBACK:
+            callback = None
+            if on_change is not None or on_prefetch is not None:
+                callback = _make_callback(
+                    component_key,
+                    default,
+                    key,
+                    on_change,
+                    args,
+                    kwargs,
+                    on_prefetch,
+                )
+            value = _st_navbar(
+                **component_args, key=component_key, on_change=callback
+            )
+            page, theme = _read_value(value, default, key)
+            if on_change is not None or on_prefetch is not None:
+                _track_value(component_key, value, page)
+        else:
+            _st_navbar(**component_args, key=component_key)
+
+    if spec.adjust:
+        if theme is None and config_theme is spec._config_theme:
+            css = spec.css
+        else:
+            with timing.phase("match_theme"):
+                ui = match_ui(spec.styles, theme or config_theme)
+            with timing.phase("render_css"):
+                css = _render_css(
+                    ui, spec.options, None, get_path("templates")
+                )
+        if timing.is_enabled():
+            timing.record("css_bytes", len(css.encode("utf-8")))
+        with timing.phase("emit_css"):
+            _emit_css(
+                css,
+                f"st_navbar_key_{key}",
+                spec.options["use_padding"],
+            )
+
+    return page
@@ -1,5 +1,11 @@
 from streamlit.errors import StreamlitAPIException
 
+from streamlit_navigation_bar.cache import LRUCache
+
+
+# Fingerprints of the arguments already checked in this process.
+_validated = LRUCache(maxsize=256)
+
 
 def _type_error(param, name, expected):
     """Format a string with markdown syntax to describe a type error."""
@@ -35,7 +41,7 @@ def _dict_error(param, name, case, value_expected):
 
 
 def check_pages(pages):
-    """Check if `pages` has a valid type and the minimum length required."""
+    """Check if `pages` has a valid type, the minimum length and no repeats."""
     if not isinstance(pages, list):
         raise StreamlitAPIException(_type_error(pages, "pages", ["list"]))
 
@@ -47,9 +53,9 @@ def check_pages(pages):
             f"\nGot: *len*(pages) == {len(pages)}"
         )
 
-    for page in pages:
+    seen = set()
+    for i, page in enumerate(pages):
         if not isinstance(page, str):
-            i = pages.index(page)
             raise StreamlitAPIException(
                 "The pages parameter from st_navbar() received a list that "
                 "has an item with an invalid type.\n"
@@ -57,10 +63,19 @@ def check_pages(pages):
                 f"\nGot: *type*(pages[{i}]) == *{type(page).__name__}*"
             )
 
+        if page in seen:
+            raise StreamlitAPIException(
+                "The pages parameter from st_navbar() received a list that "
+                "has a duplicate item. Each page name must be unique.\n"
+                f"\nExpected: *pages*.count('{page}') == 1  "
+                f"\nGot: '{page}' at pages[{pages.index(page)}] and "
+                f"pages[{i}]"
+            )
+        seen.add(page)
+
 
-def check_selected(selected, logo_page, logo_path, pages):
+def check_selected(selected, logo_page, logo_path, pages, page_set=None):
     """Check if `selected` has a valid type and value."""
-    sentinel = object()
     if selected is None or type(selected) == object:
         return
 
@@ -69,14 +84,16 @@ def check_selected(selected, logo_page, logo_path, pages):
             _type_error(selected, "selected", ["str", "None"])
         )
 
-    if selected not in pages:
+    if page_set is None:
+        page_set = pages
+    if selected not in page_set:
         if selected != logo_page:
             raise StreamlitAPIException(
                 "The selected parameter from st_navbar() received an invalid "
-                "value. The value must be contained in the pages parameter list "
-                "or be equal to the logo_page (if there is a logo).\n"
+                "value. The value must be contained in the pages parameter "
+                "list or be equal to the logo_page (if there is a logo).\n"
                 f"\nExpected: selected in pages or selected == logo_page  "
-                f"\nGot: '{selected}' not in {pages} and '{selected}' != "
+                f"\nGot: '{selected}' not in {list(pages)} and '{selected}' != "
                 f"'{logo_page}'"
             )
 
@@ -124,13 +141,14 @@ def check_urls(urls, pages):
             f"\nGot: *len*(urls) = {len(urls)}"
         )
 
+    page_set = set(pages)
     for page, url in urls.items():
         if not isinstance(page, str):
             raise StreamlitAPIException(
                 _dict_error(page, "urls", "key", "str")
             )
 
-        if page not in pages:
+        if page not in page_set:
             raise StreamlitAPIException(
                 "The urls parameter from st_navbar() received a dictionary "
                 "that has an invalid key. The key must be contained in the "
@@ -213,6 +231,7 @@ def check_options(options):
             "hide_nav",
             "fix_shadow",
             "use_padding",
+            "use_overflow",
         ]
         if option not in available:
             raise StreamlitAPIException(
@@ -220,7 +239,7 @@ def check_options(options):
                 "that has an invalid key. The key must be the name of one of "
                 "the available options.\n"
                 f"\nExpected: 'show_menu', 'show_sidebar', 'hide_nav', "
-                "'fix_shadow', 'use_padding'  "
+                "'fix_shadow', 'use_padding', 'use_overflow'  "
                 f"\nGot: '{option}'"
             )
 
@@ -238,9 +257,218 @@ def check_adjust(adjust):
         )
 
 
+def check_serve_logo(serve_logo):
+    """Check if `serve_logo` has a valid type."""
+    if not isinstance(serve_logo, bool):
+        raise StreamlitAPIException(
+            _type_error(serve_logo, "serve_logo", ["bool"])
+        )
+
+
+def check_optimize_logo(optimize_logo):
+    """Check if `optimize_logo` has a valid type."""
+    if not isinstance(optimize_logo, bool):
+        raise StreamlitAPIException(
+            _type_error(optimize_logo, "optimize_logo", ["bool"])
+        )
+
+
+def check_logo_budget(logo_budget):
+    """Check if `logo_budget` is a positive integer or None."""
+    if logo_budget is None:
+        return
+    if not isinstance(logo_budget, int) or isinstance(logo_budget, bool):
+        raise StreamlitAPIException(
+            _type_error(logo_budget, "logo_budget", ["int", "None"])
+        )
+    if logo_budget <= 0:
+        raise StreamlitAPIException(
+            "The logo_budget parameter from st_navbar() must be a positive "
+            "number of bytes.\n"
+            f"\nGot: {logo_budget}"
+        )
+
+
+def check_html(html):
+    """Check if `html` has a valid type."""
+    if not isinstance(html, bool):
+        raise StreamlitAPIException(
+            _type_error(html, "html", ["bool"])
+        )
+
+
+def check_html_callbacks(html, on_change, on_prefetch):
+    """Check that no callback is given to a navbar rendered with HTML."""
+    if not html:
+        return
+    callbacks = {"on_change": on_change, "on_prefetch": on_prefetch}
+    for name, callback in callbacks.items():
+        if callback is not None:
+            raise StreamlitAPIException(
+                f"The {name} parameter from st_navbar() cannot be used when "
+                "html is True. The navbar is then a set of links, and a "
+                "click loads the app again, in a new session."
+            )
+
+
 def check_key(key):
     """Check if `key` has a valid type."""
     if not isinstance(key, str) and not isinstance(key, int) and key is not None:
         raise StreamlitAPIException(
             _type_error(key, "key", ["str", "int", "None"])
         )
+
+
+def check_callbacks(on_change, args, kwargs, on_prefetch):
+    """Check if the callbacks and their arguments have valid types."""
+    if on_change is not None and not callable(on_change):
+        raise StreamlitAPIException(
+            _type_error(on_change, "on_change", ["callable", "None"])
+        )
+    if args is not None and not isinstance(args, (list, tuple)):
+        raise StreamlitAPIException(
+            _type_error(args, "args", ["list", "tuple", "None"])
+        )
+    if kwargs is not None and not isinstance(kwargs, dict):
+        raise StreamlitAPIException(
+            _type_error(kwargs, "kwargs", ["dict", "None"])
+        )
+    if on_prefetch is not None and not callable(on_prefetch):
+        raise StreamlitAPIException(
+            _type_error(on_prefetch, "on_prefetch", ["callable", "None"])
+        )
+
+
+def _fingerprint(
+    pages,
+    logo_path,
+    logo_page,
+    urls,
+    styles,
+    options,
+    adjust,
+    serve_logo,
+    optimize_logo,
+    logo_budget,
+    html,
+):
+    """
+    Build a hashable fingerprint of the arguments that specify a navbar.
+
+    The types are part of the fingerprint wherever equal values of different
+    types are not equally valid, e.g. ``1`` and ``True`` in `options`.
+
+    Raises
+    ------
+    TypeError or AttributeError
+        If the arguments do not have the structure expected by the fingerprint
+        or are not hashable. In this case they must be checked one by one.
+    """
+    if isinstance(urls, dict):
+        urls = tuple(urls.items())
+    if isinstance(styles, dict):
+        styles = tuple(
+            (target, type(style), tuple(style.items()))
+            for target, style in styles.items()
+        )
+    if isinstance(options, dict):
+        options = tuple(
+            (option, type(toggle), toggle)
+            for option, toggle in options.items()
+        )
+
+    fingerprint = (
+        type(pages),
+        tuple(pages),
+        logo_path,
+        logo_page,
+        type(urls),
+        urls,
+        type(styles),
+        styles,
+        type(options),
+        options,
+        type(adjust),
+        adjust,
+        type(serve_logo),
+        serve_logo,
+        type(optimize_logo),
+        optimize_logo,
+        type(logo_budget),
+        logo_budget,
+        type(html),
+        html,
+    )
+    hash(fingerprint)
+    return fingerprint
+
+
+def check_spec(
+    pages,
+    logo_path,
+    logo_page,
+    urls,
+    styles,
+    options,
+    adjust,
+    serve_logo,
+    optimize_logo,
+    logo_budget,
+    html,
+):
+    """
+    Check all the arguments that specify a navbar.
+
+    The arguments are usually the same constants on every rerun, so they are
+    identified by a fingerprint and only checked the first time they are seen
+    in the process.
+    """
+    try:
+        fingerprint = _fingerprint(
+            pages,
+            logo_path,
+            logo_page,
+            urls,
+            styles,
+            options,
+            adjust,
+            serve_logo,
+            optimize_logo,
+            logo_budget,
+            html,
+        )
+    except (TypeError, AttributeError):
+        fingerprint = None
+
+    if fingerprint is not None and _validated.get(fingerprint):
+        return
+
+    check_pages(pages)
+    check_logo_path(logo_path)
+    check_logo_page(logo_page)
+    check_urls(urls, pages)
+    check_styles(styles)
+    check_options(options)
+    check_adjust(adjust)
+    check_serve_logo(serve_logo)
+    check_optimize_logo(optimize_logo)
+    check_logo_budget(logo_budget)
+    check_html(html)
+
+    if fingerprint is not None:
+        _validated.put(fingerprint, True)
+
+
+def check_spec_args(**kwargs):
+    """Check that no other argument is given along with a navbar spec."""
+    for name, (value, default) in kwargs.items():
+        # Equal values of another type, e.g. ``1`` for ``True``, override
+        # the spec too.
+        if value is not default and (
+            type(value) is not type(default) or value != default
+        ):
+            raise StreamlitAPIException(
+                f"The {name} parameter from st_navbar() cannot be used when "
+                "the pages parameter receives a NavbarSpec. Pass it to "
+                "NavbarSpec.build() instead."
+            )
@@ -0,0 +1,76 @@
+/**
+ * Coalescing of the clicks on the pages.
+ *
+ * Each page sent to Python reruns the script. Streamlit disables the
+ * component while a rerun is in flight, so the clicks made meanwhile only
+ * keep the latest page, which is sent once the component is enabled again.
+ * A click on the page that is already the value of the component is never
+ * sent, since it would rerun the script for nothing.
+ */
+
+/**
+ * Counters of the clicks, exposed for tests. A click is `sent` when its page
+ * is posted to Python, and `suppressed` when it is redundant or replaced by a
+ * later one before it was sent.
+ */
+export const clickStats = {
+  sent: 0,
+  suppressed: 0,
+}
+
+export interface ClickQueue {
+  /** The page of the component value, sent or selected by Python. */
+  current(): string | null
+  /** The page waiting for the component to be enabled, if any. */
+  pending(): string | null
+  /** Record the page selected by Python, e.g. with a callback function. */
+  sync(page: string | null): void
+  /** Send the page clicked, or keep it while the component is disabled. */
+  click(page: string, disabled: boolean): void
+  /** Send the page kept while the component was disabled. */
+  enable(): void
+}
+
+export function createClickQueue(
+  initial: string | null,
+  send: (page: string) => void
+): ClickQueue {
+  let current = initial
+  let pending: string | null = null
+
+  const dispatch = (page: string): void => {
+    if (page === current) {
+      clickStats.suppressed += 1
+      return
+    }
+    current = page
+    clickStats.sent += 1
+    send(page)
+  }
+
+  return {
+    current: () => current,
+    pending: () => pending,
+    sync(page) {
+      current = page
+    },
+    click(page, disabled) {
+      if (pending !== null) {
+        clickStats.suppressed += 1
+        pending = null
+      }
+      if (disabled && page !== current) {
+        pending = page
+        return
+      }
+      dispatch(page)
+    },
+    enable() {
+      const page = pending
+      pending = null
+      if (page !== null) {
+        dispatch(page)
+      }
+    },
+  }
+}
@@ -0,0 +1,41 @@
+/**
+ * Measurement of the width of the pages, to fit them in the navbar.
+ *
+ * The text of each page is measured on a canvas, so the pages that are
+ * collapsed into the "More" menu never need to be rendered. The widths are
+ * cached for the version of the arguments and the font they were measured
+ * with, since they only change with them.
+ */
+
+let context: CanvasRenderingContext2D | null = null
+let cachedKey: string | null = null
+let cachedWidths: number[] = []
+
+function getContext(): CanvasRenderingContext2D | null {
+  if (context === null) {
+    context = document.createElement("canvas").getContext("2d")
+  }
+  return context
+}
+
+export function measureWidths(
+  version: string | null,
+  font: string,
+  texts: string[]
+): number[] {
+  const key = version === null ? null : `${version}|${font}`
+  if (key !== null && key === cachedKey) {
+    return cachedWidths
+  }
+  const ctx = getContext()
+  if (ctx === null) {
+    return texts.map(() => 0)
+  }
+  ctx.font = font
+  const widths = texts.map((text) => Math.ceil(ctx.measureText(text).width))
+  if (key !== null) {
+    cachedKey = key
+    cachedWidths = widths
+  }
+  return widths
+}
@@ -0,0 +1,63 @@
+/**
+ * Cache of the navbar arguments that do not change between reruns.
+ *
+ * Python identifies them by a version, the hash of their content, and only
+ * sends the version once the navbar has reported that it holds them. They are
+ * kept in memory and in the session storage, so they survive the iframe being
+ * mounted again.
+ */
+
+const STORAGE_PREFIX = "st_navbar:"
+
+export const STATIC_ARGS = [
+  "pages",
+  "base64_svg",
+  "logo_url",
+  "logo_page",
+  "urls",
+  "stylesheet",
+  "overflow",
+]
+
+const payloads = new Map<string, Record<string, unknown>>()
+
+export function storePayload(
+  version: string,
+  args: Record<string, unknown>
+): void {
+  if (payloads.has(version)) {
+    return
+  }
+  const payload: Record<string, unknown> = {}
+  for (const name of STATIC_ARGS) {
+    payload[name] = args[name]
+  }
+  payloads.set(version, payload)
+  try {
+    window.sessionStorage.setItem(
+      STORAGE_PREFIX + version,
+      JSON.stringify(payload)
+    )
+  } catch {
+    // The storage may be unavailable or full, the memory is enough.
+  }
+}
+
+export function loadPayload(
+  version: string
+): Record<string, unknown> | undefined {
+  let payload = payloads.get(version)
+  if (payload !== undefined) {
+    return payload
+  }
+  try {
+    const item = window.sessionStorage.getItem(STORAGE_PREFIX + version)
+    if (item !== null) {
+      payload = JSON.parse(item) as Record<string, unknown>
+      payloads.set(version, payload)
+    }
+  } catch {
+    // The storage may be unavailable, treat it as a miss.
+  }
+  return payload
+}
@@ -1,8 +1,55 @@
 /**
  * Vue.js specific composables
  */
-import { onMounted, onUpdated } from "vue"
-import { Streamlit } from "streamlit-component-lib"
+import { onMounted, onUnmounted, onUpdated } from "vue"
+import { Streamlit } from "./bridge"
+
+/**
+ * Counters of the frame height reports, exposed for tests. A report is
+ * `sent` when the height changed since the last one, and `skipped` when it is
+ * the same.
+ */
+export const frameHeightStats = {
+  sent: 0,
+  skipped: 0,
+}
+
+let lastFrameHeight: number | undefined = undefined
+let pendingFrame: number | undefined = undefined
+let overlayBottom = 0
+
+/**
+ * Report the height of the component to Streamlit on the next animation
+ * frame. Multiple requests within a frame are coalesced into one, and the
+ * height is only posted to the parent when it differs from the last one sent,
+ * since each message makes the host page run a layout.
+ */
+export function requestFrameHeight(): void {
+  if (pendingFrame !== undefined) {
+    return
+  }
+  pendingFrame = window.requestAnimationFrame((): void => {
+    pendingFrame = undefined
+    const height = Math.max(document.body.scrollHeight, overlayBottom)
+    if (height === lastFrameHeight) {
+      frameHeightStats.skipped += 1
+      return
+    }
+    lastFrameHeight = height
+    frameHeightStats.sent += 1
+    Streamlit.setFrameHeight(height)
+  })
+}
+
+/**
+ * Set the bottom of an element that overflows the body, such as an open menu,
+ * so the frame is tall enough to show it, and report the height. Set it to 0
+ * when the element is gone, so the frame shrinks back to the body.
+ */
+export function setFrameOverlay(bottom: number): void {
+  overlayBottom = Math.ceil(bottom)
+  requestFrameHeight()
+}
 
 export function useStreamlit() {
   /**
@@ -14,14 +61,28 @@ export function useStreamlit() {
    * so that your plugin properly resizes.
    */
 
+  let observer: ResizeObserver | undefined = undefined
+
   onMounted((): void => {
     // After we're rendered for the first time, tell Streamlit that our height
-    // has changed.
-    Streamlit.setFrameHeight()
+    // has changed. From then on, only when the body is actually resized.
+    requestFrameHeight()
+    if (typeof ResizeObserver !== "undefined") {
+      observer = new ResizeObserver((): void => requestFrameHeight())
+      observer.observe(document.body)
+    }
   })
 
   onUpdated((): void => {
-    // After we're updated, tell Streamlit that our height may have changed.
-    Streamlit.setFrameHeight()
+    // Without a ResizeObserver, tell Streamlit that our height may have
+    // changed after we're updated.
+    if (observer === undefined) {
+      requestFrameHeight()
+    }
+  })
+
+  onUnmounted((): void => {
+    observer?.disconnect()
+    observer = undefined
   })
 }
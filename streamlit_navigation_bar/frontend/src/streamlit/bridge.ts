@@ -0,0 +1,134 @@
+/**
+ * Minimal bridge between the component and Streamlit.
+ *
+ * It implements the part of `streamlit-component-lib` that the navbar uses,
+ * over the same postMessage protocol: the ready handshake, the render event,
+ * the frame height and the component value. The library also converts Arrow
+ * dataframes, which pulls `apache-arrow` into the bundle, although the navbar
+ * never sends nor receives them.
+ */
+
+/** The version of the protocol spoken with Streamlit. */
+const API_VERSION = 1
+
+/** The messages sent from the component to Streamlit. */
+enum ComponentMessageType {
+  COMPONENT_READY = "streamlit:componentReady",
+  SET_COMPONENT_VALUE = "streamlit:setComponentValue",
+  SET_FRAME_HEIGHT = "streamlit:setFrameHeight",
+}
+
+/** The theme of the app, as sent by Streamlit in each render. */
+export interface Theme {
+  base: string
+  primaryColor: string
+  backgroundColor: string
+  secondaryBackgroundColor: string
+  textColor: string
+  font: string
+}
+
+/** The data of each render event. */
+export interface RenderData {
+  args: any
+  disabled: boolean
+  theme?: Theme
+}
+
+const RENDER_EVENT = "streamlit:render"
+const events = new EventTarget()
+
+let registeredMessageListener = false
+let themeStyle: HTMLStyleElement | undefined = undefined
+let injectedTheme = ""
+
+function sendBackMsg(type: ComponentMessageType, data?: any): void {
+  window.parent.postMessage({ isStreamlitMessage: true, type, ...data }, "*")
+}
+
+/**
+ * Expose the theme as CSS variables, updating a single style element, and
+ * only when the theme changed.
+ */
+function injectTheme(theme: Theme): void {
+  const css = `
+    :root {
+      --primary-color: ${theme.primaryColor};
+      --background-color: ${theme.backgroundColor};
+      --secondary-background-color: ${theme.secondaryBackgroundColor};
+      --text-color: ${theme.textColor};
+      --font: ${theme.font};
+    }
+
+    body {
+      background-color: var(--background-color);
+      color: var(--text-color);
+    }
+  `
+  if (css === injectedTheme) {
+    return
+  }
+  if (themeStyle === undefined) {
+    themeStyle = document.createElement("style")
+    document.head.appendChild(themeStyle)
+  }
+  themeStyle.textContent = css
+  injectedTheme = css
+}
+
+function onRenderMessage(data: any): void {
+  let args = data["args"]
+  if (args == null) {
+    console.error("Got null args in onRenderMessage. This should never happen")
+    args = {}
+  }
+  const disabled = Boolean(data["disabled"])
+  const theme = data["theme"] as Theme | undefined
+  if (theme) {
+    injectTheme(theme)
+  }
+  const detail: RenderData = { disabled, args, theme }
+  events.dispatchEvent(new CustomEvent(RENDER_EVENT, { detail }))
+}
+
+function onMessageEvent(event: MessageEvent): void {
+  if (event.data?.type === RENDER_EVENT) {
+    onRenderMessage(event.data)
+  }
+}
+
+export const Streamlit = {
+  /** The event dispatched on `events` when Streamlit renders the component. */
+  RENDER_EVENT,
+  events,
+
+  /**
+   * Tell Streamlit that the component is ready to receive render events.
+   * It must be called once the listeners of `events` are added.
+   */
+  setComponentReady(): void {
+    if (!registeredMessageListener) {
+      window.addEventListener("message", onMessageEvent)
+      registeredMessageListener = true
+    }
+    sendBackMsg(ComponentMessageType.COMPONENT_READY, {
+      apiVersion: API_VERSION,
+    })
+  },
+
+  /**
+   * Report the height of the component. Use `requestFrameHeight`, which
+   * coalesces the reports and only posts the ones that changed.
+   */
+  setFrameHeight(height: number = document.body.scrollHeight): void {
+    sendBackMsg(ComponentMessageType.SET_FRAME_HEIGHT, { height })
+  },
+
+  /** Set the value returned by the component in Python, as JSON. */
+  setComponentValue(value: any): void {
+    sendBackMsg(ComponentMessageType.SET_COMPONENT_VALUE, {
+      value,
+      dataType: "json",
+    })
+  },
+}
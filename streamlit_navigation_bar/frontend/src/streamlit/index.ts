@@ -14,4 +14,10 @@
  * See the License for the specific language governing permissions and
  * limitations under the License.
  */
-export { useStreamlit } from "./StreamlitVue"
+export { Streamlit, type RenderData, type Theme } from "./bridge"
+export {
+  frameHeightStats,
+  requestFrameHeight,
+  setFrameOverlay,
+  useStreamlit,
+} from "./StreamlitVue"
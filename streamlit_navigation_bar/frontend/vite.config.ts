@@ -1,14 +1,62 @@
 import { fileURLToPath, URL } from 'node:url'
+import { gzipSync } from 'node:zlib'
 
-import { defineConfig } from 'vite'
+import { defineConfig, type Plugin } from 'vite'
 import vue from '@vitejs/plugin-vue'
 
+// The maximum size of the JS and CSS of the build, gzipped. The navbar is
+// loaded in an iframe before it can show anything, so its bundle is on the
+// critical path of every cold load.
+const BUNDLE_BUDGET = 40 * 1024
+
+// Fail the build when the gzipped bundle is over the budget.
+function bundleBudget(budget: number): Plugin {
+  return {
+    name: 'bundle-budget',
+    apply: 'build',
+    generateBundle(_options, bundle) {
+      const sizes: string[] = []
+      let total = 0
+      for (const [fileName, output] of Object.entries(bundle)) {
+        if (!/\.(js|css)$/.test(fileName)) {
+          continue
+        }
+        const source = output.type === 'chunk' ? output.code : output.source
+        const size = gzipSync(source, { level: 9 }).length
+        sizes.push(`  ${fileName}: ${(size / 1024).toFixed(2)} kB`)
+        total += size
+      }
+      const summary = `${(total / 1024).toFixed(2)} kB gzipped, ` +
+        `with a budget of ${(budget / 1024).toFixed(2)} kB`
+      if (total > budget) {
+        this.error(
+          `The bundle is over its budget: ${summary}.\n${sizes.join('\n')}`
+        )
+      }
+      console.log(`Bundle: ${summary}.`)
+    },
+  }
+}
+
 // https://vitejs.dev/config/
 export default defineConfig({
   base: './',
   plugins: [
     vue(),
+    bundleBudget(BUNDLE_BUDGET),
   ],
+  define: {
+    // The components only use the Composition API, so the Options API and
+    // the production devtools are left out of the build.
+    __VUE_OPTIONS_API__: 'false',
+    __VUE_PROD_DEVTOOLS__: 'false',
+    __VUE_PROD_HYDRATION_MISMATCH_DETAILS__: 'false',
+  },
+  build: {
+    target: 'es2020',
+    // The iframe has a single entry, so no module is ever preloaded.
+    modulePreload: { polyfill: false },
+  },
   resolve: {
     alias: {
       '@': fileURLToPath(new URL('./src', import.meta.url))
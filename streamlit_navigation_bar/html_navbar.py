@@ -0,0 +1,206 @@
+"""
+Render the navbar straight into the page, without the iframe of a component.
+
+With ``html=True``, the navbar is written with ``st.html``, with the same DOM
+and classes as the component, so the same `styles` apply. It needs no
+JavaScript: each page is a plain link that carries the page in a query
+parameter, so a click navigates the same tab, and ``st_navbar`` reads the
+page back from ``st.query_params``. This saves the document, bundle and
+handshake of the iframe, at the cost of what needs JavaScript: the "More"
+menu, which is replaced by a horizontal scroll, the theme active in the
+frontend, and the callbacks.
+
+Since a click loads the app again, it starts a new session. What must
+survive it has to be carried by the URL, e.g. in other query parameters,
+which the links keep.
+"""
+
+from html import escape
+from urllib.parse import urlencode
+
+import streamlit as st
+
+
+def page_param(key):
+    """Get the name of the query parameter that holds the page of a navbar."""
+    return "page" if key is None else str(key)
+
+
+def read_page(param, page_set, logo_page):
+    """
+    Get the page in the query parameter, if it is one of the navbar.
+
+    Parameters
+    ----------
+    param : str
+        The name of the query parameter.
+    page_set : frozenset of str
+        The pages of the navbar.
+    logo_page : str or None
+        The page of the logo, if there is one.
+
+    Returns
+    -------
+    page : str or None
+        The page in the query parameter, or ``None`` if there is none or it
+        is not a page of the navbar.
+    """
+    page = st.query_params.get(param)
+    if page in page_set or (page is not None and page == logo_page):
+        return page
+    return None
+
+
+def write_page(param, page):
+    """Keep the page in the query parameter, e.g. after ``set_page``."""
+    if st.query_params.get(param) != page:
+        st.query_params[param] = page
+
+
+def build_stylesheet(ui, options, adjust, stylesheet):
+    """
+    Build the stylesheet of the navbar rendered into the page.
+
+    The default style of the component is scoped to the navbar with
+    ``:where``, which keeps the specificity of its id only, so that the rules
+    compiled from `styles` still take precedence over it.
+
+    Parameters
+    ----------
+    ui : MatchedUI
+        The values that match Streamlit's UI elements with the navbar.
+    options : dict of {str : bool}
+        The state of each option.
+    adjust : bool
+        Whether the navbar is fixed at the top of the window, as the iframe
+        is by the CSS adjustments.
+    stylesheet : str
+        The rules compiled from `styles`.
+
+    Returns
+    -------
+    css : str
+        The stylesheet of the navbar.
+    """
+    rules = [
+        "#navbar{align-items:center;box-sizing:border-box;"
+        f"background-color:{ui.bg_color};display:flex;"
+        f"font-family:inherit;height:{ui.height};justify-content:center;"
+        "padding-left:2rem;padding-right:2rem;}",
+        "#navbar :where(*){margin:0;padding:0;}",
+        "#navbar :where(div){max-width:43.75rem;width:100%;}",
+        "#navbar :where(ul){display:flex;justify-content:space-between;"
+        "width:100%;}",
+        "#navbar :where(li){align-items:center;display:flex;"
+        "list-style:none;}",
+        "#navbar :where(a){text-decoration:none;}",
+        "#navbar :where(img){display:flex;height:1.875rem;}",
+        f"#navbar :where(span){{color:{ui.color};display:block;"
+        "text-align:center;}",
+        f"#navbar :where(.active){{color:{ui.color};font-weight:bold;}}",
+        # Stop the page names from moving when the active one is bold.
+        "#navbar :where(span)::before{content:attr(data-text);display:flex;"
+        "font-weight:bold;height:0;overflow:hidden;pointer-events:none;"
+        "user-select:none;visibility:hidden;}",
+    ]
+    if options["use_overflow"]:
+        # Without JavaScript, the pages that do not fit are scrolled to.
+        rules.append(
+            "#navbar :where(ul){column-gap:1rem;overflow-x:auto;"
+            "scrollbar-width:none;}"
+        )
+        rules.append("#navbar :where(li){flex-shrink:0;}")
+    if adjust:
+        if options["show_menu"] or options["show_sidebar"]:
+            sides = "left:2.5625rem;right:2.5625rem;"
+        else:
+            sides = "left:0;right:0;"
+        rules.append(f"#navbar{{position:fixed;top:0;{sides}z-index:9999;}}")
+        # Streamlit hides an ``st.html`` without height, which the navbar
+        # has no longer once it is fixed. Shown again, the element takes
+        # the gap between elements, which is taken back from the one below.
+        rules.append(
+            'div[data-testid="element-container"]:has('
+            "> div.stHtml > nav#navbar){display:block;margin-bottom:-1rem;}"
+        )
+    if stylesheet:
+        rules.append(stylesheet)
+    return "\n".join(rules)
+
+
+def _href(param, page, query):
+    """Build the link to a page, keeping the other query parameters."""
+    query = dict(query)
+    query[param] = page
+    return "?" + escape(urlencode(query, doseq=True))
+
+
+def _logo_src(logo_url, base64_svg):
+    """Get the source of the logo, served by Streamlit or in base64."""
+    if logo_url is not None:
+        return escape(logo_url)
+    return f"data:image/svg+xml;base64,{base64_svg}"
+
+
+def render_navbar(args, active, param):
+    """
+    Render the HTML of the navbar, with the active page highlighted.
+
+    Parameters
+    ----------
+    args : dict
+        The arguments of the component that are the same on every rerun.
+    active : str or None
+        The page highlighted in the navbar.
+    param : str
+        The name of the query parameter that holds the page.
+
+    Returns
+    -------
+    html : str
+        The HTML of the navbar.
+    """
+    query = {
+        name: st.query_params.get_all(name)
+        for name in st.query_params
+        if name != param
+    }
+    items = []
+
+    if args["base64_svg"] is not None or args["logo_url"] is not None:
+        img = (
+            f'<img src="{_logo_src(args["logo_url"], args["base64_svg"])}" '
+            'class="navbar-img" />'
+        )
+        logo_page = args["logo_page"]
+        if logo_page is None:
+            link = f'<a class="navbar-a">{img}</a>'
+        else:
+            link = (
+                f'<a href="{_href(param, logo_page, query)}" target="_self" '
+                f'class="navbar-a">{img}</a>'
+            )
+        items.append(f'<li class="navbar-li">{link}</li>')
+
+    for page in args["pages"]:
+        href, target = args["urls"][page]
+        if href == "#":
+            href = _href(param, page, query)
+            rel = ""
+        else:
+            href = escape(href)
+            rel = ' rel="noopener noreferrer"'
+        name = escape(page)
+        active_class = " active" if page == active else ""
+        items.append(
+            '<li class="navbar-li">'
+            f'<a href="{href}" target="{target}"{rel} class="navbar-a">'
+            f'<span data-text="{name}" class="navbar-span{active_class}">'
+            f"{name}</span></a></li>"
+        )
+
+    return (
+        '<nav id="navbar"><div class="navbar-div"><ul class="navbar-ul">'
+        + "".join(items)
+        + "</ul></div></nav>"
+    )
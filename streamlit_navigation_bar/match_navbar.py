@@ -1,5 +1,180 @@
-from streamlit.config import get_config_options
-from streamlit_theme import st_theme
+import threading
+import warnings
+
+from streamlit.config import get_config_options, on_config_parsed
+
+from streamlit_navigation_bar.cache import LRUCache
+
+
+# Streamlit's preset themes, used when a value is not in the config options.
+base_themes = {
+    "light": {
+        "primaryColor": "#ff4b4b",
+        "backgroundColor": "#ffffff",
+        "secondaryBackgroundColor": "#f0f2f6",
+        "textColor": "#31333F",
+        "font": '"Source Sans Pro", sans-serif',
+    },
+    "dark": {
+        "primaryColor": "#ff4b4b",
+        "backgroundColor": "#0e1117",
+        "secondaryBackgroundColor": "#262730",
+        "textColor": "#fafafa",
+        "font": '"Source Sans Pro", sans-serif',
+    },
+}
+
+# Snapshot of the theme config options, which is taken once and invalidated
+# only when Streamlit parses the config files again. A snapshot is never
+# modified once published, it is replaced by a new one.
+_config_index = None
+_config_connected = False
+_config_index_lock = threading.Lock()
+
+# The matched UI values are shared by all sessions with the same inputs.
+_ui_cache = LRUCache(maxsize=128)
+
+
+def _invalidate_config_index():
+    """Discard the snapshot of the theme config options."""
+    global _config_index
+    with _config_index_lock:
+        _config_index = None
+
+
+def _get_config_index():
+    """
+    Get the snapshot of the theme config options, taking it if necessary.
+
+    Returns
+    -------
+    index : dict of {str : dict of {str : str}}
+        A dictionary with ``"configs"``, which maps each theme variable name to
+        its config option value (possibly ``None``), and ``"theme"``, which is
+        the same completed with the values of the preset theme.
+    """
+    global _config_index, _config_connected
+    index = _config_index
+    if index is not None:
+        return index
+
+    with _config_index_lock:
+        index = _config_index
+        if index is not None:
+            return index
+
+        # Parse the config files, if not yet parsed, before connecting.
+        config_options = get_config_options()
+        if not _config_connected:
+            on_config_parsed(_invalidate_config_index, force_connect=True)
+            _config_connected = True
+
+        configs = {}
+        for theme_config in MatchNavbar.configs.values():
+            option = config_options[f"theme.{theme_config}"]
+            configs[theme_config] = option.value
+
+        if config_options["theme.base"].value == "dark":
+            theme = dict(base_themes["dark"])
+        else:
+            theme = dict(base_themes["light"])
+        for theme_config, value in configs.items():
+            if value is not None:
+                theme[theme_config] = value
+
+        index = {"configs": configs, "theme": theme}
+        _config_index = index
+    return index
+
+
+def get_config_theme():
+    """
+    Get the theme defined by the configuration options.
+
+    The theme variables that are not set in the configuration options, like a
+    TOML file, take the value of the preset theme they inherit from. The
+    returned dictionary is shared and must not be modified.
+
+    Returns
+    -------
+    theme : dict of {str : str}
+        A dictionary with the name of the theme variable as the key and its
+        value.
+    """
+    return _get_config_index()["theme"]
+
+
+def match_ui(styles, theme):
+    """
+    Get the UI values that match the navbar, reusing previous results.
+
+    The result only depends on the few CSS properties of `styles` that are
+    matched and on the theme variables, so these are used as the cache key.
+
+    Parameters
+    ----------
+    styles : dict of {str : dict of {str : str}} or None
+        A dictionary with the HTML tag or pseudo-class name as the key and
+        another dictionary to style it as the value.
+    theme : dict of {str : str} or None
+        A dictionary with the name of the theme variable as the key and its
+        value.
+
+    Returns
+    -------
+    ui : MatchedUI
+        The values to style Streamlit's UI elements seamlessly with the navbar.
+    """
+    matched = MatchNavbar.get_styles(styles)
+    if theme is None:
+        themed = None
+    else:
+        themed = tuple(theme.get(name) for name in MatchNavbar.configs.values())
+
+    cache_key = (matched, themed)
+    ui = _ui_cache.get(cache_key)
+    if ui is None:
+        ui = MatchNavbar(styles, theme=theme).resolve(matched)
+        _ui_cache.put(cache_key, ui)
+    return ui
+
+
+class MatchedUI():
+    """
+    Represent the values of a user interface that matches the navbar.
+
+    Attributes
+    ----------
+    height : str
+        The height of the navbar.
+    color : str
+        The color of the page names, used for the menu and sidebar buttons.
+    bg_color : str
+        The background color of the navbar, used for Streamlit's header.
+    hover_color : str
+        The color of the page names on hover.
+    hover_bg_color : str
+        The background color of the page names on hover.
+    """
+
+    __slots__ = ("height", "color", "bg_color", "hover_color", "hover_bg_color")
+
+    def __init__(self, height, color, bg_color, hover_color, hover_bg_color):
+        self.height = height
+        self.color = color
+        self.bg_color = bg_color
+        self.hover_color = hover_color
+        self.hover_bg_color = hover_bg_color
+
+    def astuple(self):
+        """Get the values as a tuple, in the order of the attributes."""
+        return (
+            self.height,
+            self.color,
+            self.bg_color,
+            self.hover_color,
+            self.hover_bg_color,
+        )
 
 
 class MatchNavbar():
@@ -17,13 +192,17 @@ class MatchNavbar():
         the key-value pair is the name of a CSS property and the value it
         takes, both in string format. It accepts CSS variables to be passed as
         values.
-    key : str, int or None
-        A key associated with the container that gets the theme. This needs to
-        be unique since all styles will be applied to the container with this
-        key.
+    theme : dict of {str : str} or None
+        A dictionary with the name of the theme variable as the key and its
+        value. It is the theme active in the frontend, as reported by the
+        navbar, or the one defined by the configuration options.
 
     Methods
     -------
+    get_styles(styles)
+        Get the values from the styles dictionary that are matched.
+    resolve(matched=None)
+        Get all the UI values that match the navbar, in a single pass.
     get_value(css_property, targets, default, theme_config=None)
         Get the value of a CSS property.
     """
@@ -36,7 +215,9 @@ class MatchNavbar():
         "var(--font)": "font",
     }
 
-    def __init__(self, styles, key):
+    __slots__ = ("styles", "theme")
+
+    def __init__(self, styles, key=None, *, theme=None):
         """
         Instantiate a user interface object to get CSS that matches the navbar.
 
@@ -48,29 +229,111 @@ class MatchNavbar():
             dictionary, the key-value pair is the name of a CSS property and
             the value it takes, both in string format. It accepts CSS variables
             to be passed as values.
-        key : str, int or None
-            A key associated with the container that gets the theme. This needs
-            to be unique since all styles will be applied to the container with
-            this key.
+        key : str, int or None, optional
+            Deprecated and ignored. It was the key of the container that got
+            the theme, which is now reported by the navbar and given in
+            `theme`.
+        theme : dict of {str : str} or None, optional
+            A dictionary with the name of the theme variable as the key and its
+            value. It is the theme active in the frontend, as reported by the
+            navbar, or the one defined by the configuration options.
         """
+        if key is not None:
+            warnings.warn(
+                "The key parameter of MatchNavbar() is deprecated and "
+                "ignored. Pass the theme with the theme keyword instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.styles = styles
-        self.theme = st_theme(key=f"key_{key}")
+        self.theme = theme
+
+    @staticmethod
+    def get_styles(styles):
+        """
+        Get the values from the styles dictionary that are matched.
+
+        Parameters
+        ----------
+        styles : dict of {str : dict of {str : str}} or None
+            A dictionary with the HTML tag or pseudo-class name as the key and
+            another dictionary to style it as the value.
+
+        Returns
+        -------
+        matched : tuple of str or None
+            The values of the height and background color of ``"nav"``, the
+            background color and color of ``"hover"`` and the color of
+            ``"span"``. Each one is ``None`` when it is not in `styles`.
+        """
+        if not styles:
+            return (None, None, None, None, None)
+
+        nav = styles.get("nav") or {}
+        hover = styles.get("hover") or {}
+        span = styles.get("span") or {}
+        return (
+            nav.get("height"),
+            nav.get("background-color"),
+            hover.get("background-color"),
+            hover.get("color"),
+            span.get("color"),
+        )
+
+    def resolve(self, matched=None):
+        """
+        Get all the UI values that match the navbar, in a single pass.
+
+        Parameters
+        ----------
+        matched : tuple of str or None, optional
+            The values from the styles dictionary, as returned by
+            `get_styles`. Defaults to ``None``, where they are taken from
+            `styles`.
+
+        Returns
+        -------
+        ui : MatchedUI
+            The values to style Streamlit's UI elements seamlessly with the
+            navbar.
+        """
+        if matched is None:
+            matched = self.get_styles(self.styles)
+        nav_height, nav_bg_color, hover_bg_color, hover_color, color = matched
+        if hover_color is None:
+            hover_color = color
+
+        return MatchedUI(
+            height=self._match(nav_height, "2.875rem"),
+            color=self._match(color, "rgb(49, 51, 63)", "textColor"),
+            bg_color=self._match(
+                nav_bg_color,
+                "rgb(240, 242, 246)",
+                "secondaryBackgroundColor",
+            ),
+            hover_color=self._match(
+                hover_color,
+                "rgb(49, 51, 63)",
+                "textColor",
+            ),
+            hover_bg_color=self._match(hover_bg_color, "transparent"),
+        )
 
     def _get_theme_config(self, theme_configs):
         """
         Get the value of a CSS property from the theme or config option.
 
         Try to find the value with the name at the beginning of the list.
-        Search first in the frontend theme object and then in the configuration
-        options. In case it does not find it, iterates to the next name.
-        Whenever the value is found it is returned immediately. If at the end
-        it is still not found, returns ``None``.
+        Search first in the theme dictionary and then in the snapshot of the
+        configuration options. In case it does not find it, iterates to the
+        next name. Whenever the value is found it is returned immediately. If
+        at the end it is still not found, returns ``None``.
 
         Parameters
         ----------
         theme_configs : list of str
-            A list with the names of the frontend theme variables, which are
-            also Streamlit's configuration options, to get the value from.
+            A list with the names of the theme variables, which are also
+            Streamlit's configuration options, to get the value from.
 
         Returns
         -------
@@ -79,7 +342,7 @@ class MatchNavbar():
             options. If not found, returns ``None``.
         """
         theme = self.theme
-        configs = self.configs.values()
+        configs = _get_config_index()["configs"]
 
         # Get the value for the var in `styles`, then, for the `theme_config`.
         for theme_config in theme_configs:
@@ -89,11 +352,10 @@ class MatchNavbar():
                 return theme[theme_config]
 
             # Return the CSS value from configs, like a TOML file.
-            if theme_config in configs:
-                value = get_config_options()[f"theme.{theme_config}"].value
-                if value is not None:
-                    return value
-        
+            value = configs.get(theme_config)
+            if value is not None:
+                return value
+
         # Not found.
         return None
 
@@ -106,9 +368,9 @@ class MatchNavbar():
         value is found it is returned immediately. If at the end it is still
         not found, returns ``None``.
 
-        The value found and returned will be either a plain CSS value, or the
-        name of a theme variable and config option, which the
-        `_get_theme_config` function will get its value later.
+        The value found and returned will be either a plain CSS value, or a
+        CSS variable, which the `_match` function will change to the name of
+        a theme variable and config option, to get its value later.
 
         Parameters
         ----------
@@ -126,27 +388,68 @@ class MatchNavbar():
         Returns
         -------
         value : str or None
-            The value of the CSS property or the name of the theme variable and
-            config option, found in `styles`. If not found, returns ``None``.
+            The value of the CSS property or a CSS variable, found in
+            `styles`. If not found, returns ``None``.
         """
         styles = self.styles
-        configs = self.configs
 
         # Search for the CSS value in `styles`.
         for target in targets:
             if target in styles and css_property in styles[target]:
-                value = styles[target][css_property]
-
-                # Return a plain value.
-                if value not in configs:
-                    return value
-
-                # Return `var(--theme-variable)` changed to `themeVariable`.
-                return configs[value]
+                return styles[target][css_property]
 
         # Not found.
         return None
 
+    def _match(self, value, default, theme_config=None):
+        """
+        Get the matching value from a value found in the styles dictionary.
+
+        Parameters
+        ----------
+        value : str or None
+            The plain CSS value or CSS variable found in `styles`, or ``None``
+            if not found.
+        default : str
+            The default value to be returned, in case it is not found in
+            `styles`, `theme` or config options.
+        theme_config : str, optional
+            The name of the theme variable, which is also Streamlit's
+            configuration option, to get the value from. Defaults to ``None``,
+            where the function does not go through the theme and configuration
+            steps in the search sequence.
+
+        Returns
+        -------
+        value : str
+            The value of the CSS property found in `styles`, `theme`, config
+            options or a default.
+        """
+        configs = self.configs
+
+        # Return plain value found in `styles`.
+        if value is not None and value not in configs:
+            return value
+
+        # Not found in `styles` and no need to search in `theme` or configs.
+        if value is None and theme_config is None:
+            return default
+
+        # Theme variable and config option found in `styles`, changed from
+        # `var(--theme-variable)` to `themeVariable`.
+        theme_configs = []
+        if value is not None:
+            theme_configs.append(configs[value])
+
+        theme_configs.append(theme_config)
+        value = self._get_theme_config(theme_configs)
+
+        # Not found, return the default.
+        if value is None:
+            return default
+
+        return value
+
     def get_value(self, css_property, targets, default, theme_config=None):
         """
         Get the value of a CSS property.
@@ -154,11 +457,11 @@ class MatchNavbar():
         Search for the value to style Streamlit's header and UI elements, e.g.
         menu and sidebar buttons, seamlessly with the navbar.
 
-        It tries to first find it in the styles dictionary, then in the
-        frontend theme object and finally in the configuration options. When it
-        does not find with the first method, it goes to the next one in the
-        sequence. Whenever the value is found it is returned immediately. If at
-        the end it is still not found, returns a default value.
+        It tries to first find it in the styles dictionary, then in the theme
+        dictionary and finally in the configuration options. When it does not
+        find with the first method, it goes to the next one in the sequence.
+        Whenever the value is found it is returned immediately. If at the end
+        it is still not found, returns a default value.
 
         Parameters
         ----------
@@ -176,7 +479,7 @@ class MatchNavbar():
             The default value to be returned, in case the CSS property is not
             found in `styles`, `theme` or config options.
         theme_config : str, optional
-            The name of the frontend theme variable, which is also Streamlit's
+            The name of the theme variable, which is also Streamlit's
             configuration option, to get the value from. Defauls to ``None``,
             where the function does not go through the theme and configuration
             steps in the search sequence.
@@ -187,30 +490,7 @@ class MatchNavbar():
             The value of the CSS property found in `styles`, `theme`, config
             options or a default.
         """
-        configs = self.configs.values()
         value = None
-        theme_configs = []
-
         if self.styles is not None:
             value = self._get_style(css_property, targets)
-
-        # Return plain value found in `styles`.
-        if value is not None and value not in configs:
-            return value
-
-        # Not found in `styles` and no need to search in `theme` or configs.
-        if value is None and theme_config is None:
-            return default
-
-        # Theme variable and config option found in `styles`.
-        if value in configs:
-            theme_configs.append(value)
-
-        theme_configs.append(theme_config)
-        value = self._get_theme_config(theme_configs)
-
-        # Not found, return the default.
-        if value is None:
-            return default
-
-        return value
+        return self._match(value, default, theme_config)
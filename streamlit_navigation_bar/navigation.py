@@ -0,0 +1,174 @@
+import re
+
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+
+# The class of st.Page objects, looked up once.
+_page_class = []
+
+
+def _get_page_class():
+    """Get the class of ``st.Page`` objects, if Streamlit provides it."""
+    if not _page_class:
+        try:
+            from streamlit.navigation.page import StreamlitPage
+        except ImportError:
+            StreamlitPage = None
+        _page_class.append(StreamlitPage)
+    return _page_class[0]
+
+
+def is_routed(pages):
+    """Check if `pages` are to be routed with ``st.navigation``."""
+    if isinstance(pages, dict):
+        return True
+    if not isinstance(pages, (list, tuple)):
+        return False
+    page_class = _get_page_class()
+    if page_class is None:
+        return False
+    return any(isinstance(page, page_class) for page in pages)
+
+
+def _slugify(title):
+    """Get the URL path of a page from its title."""
+    return re.sub(r"[^0-9a-zA-Z]+", "_", title).strip("_").lower()
+
+
+def _get_routes(pages):
+    """
+    Map the title of each page in the navbar to its ``st.Page`` object.
+
+    Parameters
+    ----------
+    pages : list of st.Page or dict of {str : st.Page, callable or str}
+        The ``st.Page`` objects, whose titles are shown in the navbar, or a
+        dictionary with the title as the key and the page as the value. A page
+        that is a callable or a path to a script is wrapped in a ``st.Page``.
+
+    Returns
+    -------
+    routes : dict of {str : st.Page}
+        A dictionary with the title as the key and the page as the value, in
+        the order of the navbar.
+    """
+    page_class = _get_page_class()
+
+    if not isinstance(pages, dict):
+        routes = {}
+        for page in pages:
+            if not isinstance(page, page_class):
+                raise StreamlitAPIException(
+                    "The pages parameter from st_navbar() received a list "
+                    "that mixes st.Page objects with other types. Either all "
+                    "of them must be st.Page objects, or none.\n"
+                    f"\nGot: {type(page).__name__}"
+                )
+            routes[page.title] = page
+        return routes
+
+    routes = {}
+    for title, page in pages.items():
+        if not isinstance(title, str):
+            raise StreamlitAPIException(
+                "The pages parameter from st_navbar() received a dictionary "
+                "with a key that is not a string. The keys must be the page "
+                "titles.\n"
+                f"\nGot: {type(title).__name__}"
+            )
+        if isinstance(page, page_class):
+            routes[title] = page
+        elif callable(page):
+            routes[title] = st.Page(
+                page, title=title, url_path=_slugify(title)
+            )
+        elif isinstance(page, str):
+            routes[title] = st.Page(page, title=title)
+        else:
+            raise StreamlitAPIException(
+                "The pages parameter from st_navbar() received a dictionary "
+                "with an invalid value. The values must be st.Page objects, "
+                "callables or paths to Python files.\n"
+                f"\nGot: {type(page).__name__}"
+            )
+    return routes
+
+
+def navigate(pages, has_selected, key, navbar, **kwargs):
+    """
+    Place a navbar that drives ``st.navigation`` and ``st.switch_page``.
+
+    The page is selected by ``st.navigation`` from the URL, so it can be
+    linked to and browsed with the back and forward buttons, and the navbar
+    highlights it. A page clicked in the navbar is switched to with
+    ``st.switch_page``, before any page runs.
+
+    Parameters
+    ----------
+    pages : list of st.Page or dict of {str : st.Page, callable or str}
+        The pages of the app, as in ``_get_routes``.
+    has_selected : bool
+        Whether the `selected` parameter of ``st_navbar`` was set, which is
+        not allowed, since the page is selected by the URL.
+    key : str, int or None
+        The key of the navbar. Defaults to a fixed key, since the navbar must
+        keep its state across the pages.
+    navbar : callable
+        The function that places the navbar, given the page titles.
+    **kwargs
+        The other parameters of ``st_navbar``.
+
+    Returns
+    -------
+    page : st.Page
+        The current page, to be run with its ``run`` method.
+    """
+    if not hasattr(st, "navigation"):
+        raise StreamlitAPIException(
+            "The pages parameter from st_navbar() only accepts st.Page "
+            "objects and callables with Streamlit 1.36.0 or later, which "
+            "introduced st.navigation. Upgrade Streamlit, or pass the page "
+            "names as strings."
+        )
+    if has_selected:
+        raise StreamlitAPIException(
+            "The selected parameter from st_navbar() cannot be used with "
+            "st.Page objects or callables, since the page is selected by the "
+            "URL. Pass default=True to the st.Page to be selected by default "
+            "instead."
+        )
+
+    routes = _get_routes(pages)
+    current = st.navigation(list(routes.values()), position="hidden")
+    title = next(
+        (
+            name
+            for name, page in routes.items()
+            if page.url_path == current.url_path
+        ),
+        current.title,
+    )
+
+    if key is None:
+        key = "st_navbar_navigation"
+    # A page set in the session state since the last run, e.g. with
+    # ``set_page`` or by the `on_change` callback, is switched to.
+    titles = st.session_state.setdefault("_st_navbar_titles", {})
+    requested = st.session_state.get(key)
+    if (
+        key in titles
+        and requested != titles[key]
+        and requested != title
+        and requested in routes
+    ):
+        st.switch_page(routes[requested])
+    titles[key] = title
+    # The page selected by the URL takes precedence over the last one clicked,
+    # e.g. when the back button is used, until the navbar is clicked again.
+    st.session_state[key] = title
+
+    page = navbar(list(routes), selected=title, key=key, **kwargs)
+    if page != title and page in routes:
+        st.switch_page(routes[page])
+    return current
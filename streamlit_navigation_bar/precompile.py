@@ -0,0 +1,157 @@
+"""
+Precompile the CSS adjustments for every combination of options.
+
+The templates of the CSS adjustments only vary with the options that affect
+the CSS and with five values of the UI. So every combination of the options is
+rendered once, at build time, with the values of the UI expressed as CSS
+custom properties. At runtime, the sheet of the options is selected and the
+values are set in a small ``:root`` block, without rendering any template.
+
+The sheets are stored in ``compiled.json``, next to the templates, along with
+a hash of the templates they were rendered from. If the templates change and
+the sheets are not compiled again, they are ignored and the templates are
+rendered with Jinja instead.
+
+Usage: python -m streamlit_navigation_bar.precompile
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import threading
+
+
+# The options that change the CSS adjustments, in the order of the bits of
+# the identifier of each sheet.
+CSS_OPTIONS = (
+    "show_menu",
+    "show_sidebar",
+    "hide_nav",
+    "fix_shadow",
+    "use_overflow",
+)
+
+# The custom property of each value of the UI.
+UI_VARIABLES = {
+    "height": "--stnb-height",
+    "color": "--stnb-color",
+    "bg_color": "--stnb-bg-color",
+    "hover_color": "--stnb-hover-color",
+    "hover_bg_color": "--stnb-hover-bg-color",
+}
+
+TEMPLATES = ("base.css", "options.css")
+COMPILED = "compiled.json"
+
+_sheets = {}
+_sheets_lock = threading.Lock()
+
+
+class _VariableUI():
+    """Represent the values of the UI by their custom properties."""
+
+    def __getattr__(self, name):
+        try:
+            return f"var({UI_VARIABLES[name]})"
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def options_id(options):
+    """Identify the combination of the options that change the CSS."""
+    return "".join("1" if options[name] else "0" for name in CSS_OPTIONS)
+
+
+def source_digest(path):
+    """Get a hash of the templates in a directory."""
+    digest = hashlib.sha256()
+    for name in TEMPLATES:
+        with open(os.path.join(path, name), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def render_root(ui):
+    """Render the block that sets the values of the UI."""
+    declarations = "".join(
+        f"    {variable}: {getattr(ui, name)};\n"
+        for name, variable in UI_VARIABLES.items()
+    )
+    return ":root {\n" + declarations + "}\n"
+
+
+def compile_sheets(env):
+    """
+    Render the templates for every combination of the options.
+
+    Parameters
+    ----------
+    env : jinja2.Environment
+        The environment that loads the templates.
+
+    Returns
+    -------
+    sheets : dict of {str : str}
+        A dictionary with the identifier of the options as the key and the
+        CSS adjustments rendered for them as the value.
+    """
+    template = env.get_template("options.css")
+    sheets = {}
+    for toggles in itertools.product((True, False), repeat=len(CSS_OPTIONS)):
+        options = dict(zip(CSS_OPTIONS, toggles))
+        sheets[options_id(options)] = template.render(
+            ui=_VariableUI(),
+            options=options,
+            margin=options["show_menu"] or options["show_sidebar"],
+            key=None,
+        )
+    return sheets
+
+
+def load_sheets(path):
+    """
+    Load the precompiled sheets of a directory, once per process.
+
+    Returns
+    -------
+    sheets : dict of {str : str} or None
+        The precompiled sheets, or ``None`` if there are none or they were
+        compiled from templates different from the current ones.
+    """
+    try:
+        return _sheets[path]
+    except KeyError:
+        pass
+
+    with _sheets_lock:
+        if path not in _sheets:
+            sheets = None
+            try:
+                with open(os.path.join(path, COMPILED)) as file:
+                    compiled = json.load(file)
+                if compiled["source"] == source_digest(path):
+                    sheets = compiled["sheets"]
+            except (OSError, ValueError, KeyError):
+                pass
+            _sheets[path] = sheets
+        return _sheets[path]
+
+
+def main():
+    """Compile the sheets of the templates of the package."""
+    from streamlit_navigation_bar.core import get_path, load_env
+
+    path = get_path("templates")
+    compiled = {
+        "source": source_digest(path),
+        "sheets": compile_sheets(load_env(path)),
+    }
+    with open(os.path.join(path, COMPILED), "w") as file:
+        json.dump(compiled, file, indent=2, sort_keys=True)
+        file.write("\n")
+    print(f"Compiled {len(compiled['sheets'])} sheets to {COMPILED}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Run the page selected in the navbar, importing its module on first visit.
+
+A router maps the name of each page to the callable that renders it, given
+directly or as the path ``"module:function"`` to a function in a module. The
+module of a page is only imported when the page is first run, and the
+function found in it is cached for every session of the process. This way, a
+page that imports heavy libraries does not slow down the sessions that never
+visit it.
+
+When the instrumentation of ``timing`` is enabled, the import of each page
+module is recorded as the ``"import:<page>"`` phase and each render of a page
+as the ``"page:<page>"`` phase.
+
+Examples
+--------
+>>> from streamlit_navigation_bar import Router, st_navbar
+>>> router = Router({
+...     "Home": "pages.home:home",
+...     "Page 1": "pages.page_1:page_1",
+...     "Page 2": "pages.page_2:page_2",
+... })
+>>> page = st_navbar(router.pages)
+>>> router.run(page)
+"""
+
+from importlib import import_module
+
+from streamlit.errors import StreamlitAPIException
+
+from streamlit_navigation_bar import timing
+
+
+# The functions imported from each path, shared by all sessions. The import
+# lock of Python, which is per module, makes each module be imported once,
+# without blocking the imports of other pages.
+_targets = {}
+
+
+def _check_routes(routes):
+    """Check if `routes` maps strings to callables or paths to functions."""
+    if not isinstance(routes, dict):
+        raise StreamlitAPIException(
+            "Router() received an invalid type for the routes.\n"
+            "\nExpected: *dict of str: callable or str*  "
+            f"\nGot: *{type(routes).__name__}*"
+        )
+    for name, target in routes.items():
+        if not isinstance(name, str):
+            raise StreamlitAPIException(
+                "Router() received a page name with an invalid type.\n"
+                "\nExpected: *str*  "
+                f"\nGot: *{type(name).__name__}*"
+            )
+        if callable(target):
+            continue
+        if not isinstance(target, str):
+            raise StreamlitAPIException(
+                f"Router() received an invalid type for the {name!r} page.\n"
+                "\nExpected: *callable or str*  "
+                f"\nGot: *{type(target).__name__}*"
+            )
+        module, _, function = target.partition(":")
+        if not module or not function:
+            raise StreamlitAPIException(
+                f"Router() received an invalid path for the {name!r} page. "
+                "It must have the form `module:function`, e.g. "
+                "`pages.home:home`.\n"
+                f"\nGot: {target!r}"
+            )
+
+
+def _import_target(path):
+    """Import the function at a ``"module:function"`` path, once."""
+    try:
+        return _targets[path]
+    except KeyError:
+        pass
+
+    module_name, _, function_name = path.partition(":")
+    target = import_module(module_name)
+    for attribute in function_name.split("."):
+        target = getattr(target, attribute)
+    return _targets.setdefault(path, target)
+
+
+class Router():
+    """
+    Run the page selected in the navbar, importing it on first visit.
+
+    Parameters
+    ----------
+    routes : dict of {str : callable or str}
+        A dictionary with the page name as the key and, as the value, the
+        function that renders the page or its path, in the form
+        ``"module:function"``. The module is imported when the page is first
+        run, in any session.
+
+    Attributes
+    ----------
+    pages : list of str
+        The name of each page, in order, to be passed to ``st_navbar``.
+
+    Methods
+    -------
+    run(page)
+        Render a page.
+    resolve(page)
+        Get the function that renders a page, importing it if needed.
+    """
+
+    def __init__(self, routes):
+        _check_routes(routes)
+        self._routes = dict(routes)
+        self.pages = list(routes)
+
+    def __repr__(self):
+        return f"Router(pages={self.pages!r})"
+
+    def resolve(self, page):
+        """
+        Get the function that renders a page, importing it if needed.
+
+        Parameters
+        ----------
+        page : str
+            The name of the page.
+
+        Returns
+        -------
+        function : callable
+            The function that renders the page.
+        """
+        try:
+            target = self._routes[page]
+        except KeyError:
+            raise StreamlitAPIException(
+                f"The {page!r} page is not in the router. The pages are: "
+                f"{', '.join(repr(name) for name in self.pages)}."
+            ) from None
+        if callable(target):
+            return target
+        if target in _targets:
+            return _targets[target]
+        with timing.phase(f"import:{page}"):
+            return _import_target(target)
+
+    def run(self, page):
+        """
+        Render a page.
+
+        Parameters
+        ----------
+        page : str or None
+            The name of the page, as returned by ``st_navbar``. When it is
+            ``None``, nothing is rendered.
+
+        Returns
+        -------
+        result : any
+            The value returned by the function that renders the page, or
+            ``None`` if no page was rendered.
+        """
+        if page is None:
+            return None
+        function = self.resolve(page)
+        with timing.phase(f"page:{page}"):
+            return function()
@@ -0,0 +1,294 @@
+"""
+Optimize the SVG of the logo, to reduce the bytes sent to the navbar.
+
+SVGs exported by editors carry a lot that does not change how they look:
+comments, the XML declaration and doctype, metadata, editor namespaces,
+whitespace between the elements, numbers with more decimals than can be seen
+and definitions that are never used. The optimization removes all of it,
+without changing the drawing.
+
+The optimized SVGs are cached by the hash of their content, for every session
+of the process. An SVG that cannot be parsed, or that would get larger, is
+kept as it is.
+"""
+
+import hashlib
+import io
+import re
+import xml.etree.ElementTree as ET
+
+from streamlit_navigation_bar.cache import LRUCache
+
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+
+# The namespaces of the editors, whose elements and attributes only matter to
+# the editor that wrote them.
+EDITOR_NAMESPACES = (
+    "http://www.inkscape.org/namespaces/inkscape",
+    "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+    "http://www.bohemiancoding.com/sketch/ns",
+    "http://ns.adobe.com/",
+    "http://www.serif.com/",
+    "http://purl.org/dc/elements/1.1/",
+    "http://creativecommons.org/ns#",
+    "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+)
+
+# The attributes with numbers whose precision is reduced.
+NUMERIC_ATTRIBUTES = {
+    "d",
+    "points",
+    "transform",
+    "x",
+    "y",
+    "x1",
+    "y1",
+    "x2",
+    "y2",
+    "cx",
+    "cy",
+    "r",
+    "rx",
+    "ry",
+    "dx",
+    "dy",
+    "stroke-width",
+}
+
+# The elements whose whitespace is part of the content.
+TEXT_ELEMENTS = {"text", "tspan", "textPath", "style", "script"}
+
+_number = re.compile(r"[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?")
+_path_command = re.compile(r"[MmZzLlHhVvCcSsQqTtAa]")
+_reference = re.compile(r"#([\w.:-]+)")
+
+_optimized = LRUCache(maxsize=32)
+
+
+def _local_name(name):
+    """Get the name of an element or attribute without its namespace."""
+    return name.rpartition("}")[2]
+
+
+def _namespace(name):
+    """Get the namespace of an element or attribute, or an empty string."""
+    if name.startswith("{"):
+        return name[1:name.index("}")]
+    return ""
+
+
+def _is_editor(name):
+    """Check if an element or attribute belongs to an editor namespace."""
+    namespace = _namespace(name)
+    return bool(namespace) and namespace.startswith(EDITOR_NAMESPACES)
+
+
+def _format_number(text, precision):
+    """Round a number to the precision, with the shortest representation."""
+    if "." not in text and "e" not in text and "E" not in text:
+        # An integer is already as short as it gets, and rewriting it would
+        # change digits that are not a number, like the flags of an arc.
+        return text
+    value = round(float(text), precision)
+    formatted = f"{value:.{precision}f}".rstrip("0").rstrip(".")
+    if formatted in ("-0", ""):
+        formatted = "0"
+    if formatted.startswith("0."):
+        formatted = formatted[1:]
+    elif formatted.startswith("-0."):
+        formatted = "-" + formatted[2:]
+    return formatted if len(formatted) < len(text) else text
+
+
+def _format_numbers(value, precision, path=False):
+    """
+    Round the numbers of an attribute to the precision.
+
+    In path data, the flags of an arc are single digits that may be written
+    together with the next number, e.g. ``a5 5 0 0110 10``, so they are read
+    one digit at a time and kept as they are.
+    """
+    parts = []
+    command = ""
+    count = 0
+    last = ""
+    last_end = -1
+    pos = 0
+    while pos < len(value):
+        match = _number.match(value, pos)
+        if match is None:
+            char = value[pos]
+            if path and _path_command.match(char):
+                command = char
+                count = 0
+            parts.append(char)
+            pos += 1
+            continue
+        if command in ("A", "a") and count % 7 in (3, 4):
+            parts.append(value[pos])
+            last = ""
+            pos += 1
+            count += 1
+            continue
+        formatted = _format_number(match.group(0), precision)
+        if (
+            pos == last_end
+            and formatted.startswith(".")
+            and "." not in last
+            and last[-1:].isdigit()
+        ):
+            # The previous number lost its point, which separated the two.
+            parts.append(" ")
+        parts.append(formatted)
+        last = formatted
+        last_end = pos = match.end()
+        count += 1
+    return "".join(parts)
+
+
+def _clean(element, precision, in_text=False):
+    """Remove the metadata, editor data and whitespace of an element."""
+    in_text = in_text or _local_name(element.tag) in TEXT_ELEMENTS
+    for name in list(element.attrib):
+        if _is_editor(name):
+            del element.attrib[name]
+        elif _local_name(name) in NUMERIC_ATTRIBUTES:
+            value = _format_numbers(
+                element.attrib[name], precision, _local_name(name) == "d"
+            )
+            element.attrib[name] = " ".join(value.split())
+
+    for child in list(element):
+        if not isinstance(child.tag, str):
+            element.remove(child)  # A comment or processing instruction.
+        elif _is_editor(child.tag) or _local_name(child.tag) == "metadata":
+            element.remove(child)
+        else:
+            _clean(child, precision, in_text)
+
+    if not in_text:
+        if element.text is not None and not element.text.strip():
+            element.text = None
+        for child in element:
+            if child.tail is not None and not child.tail.strip():
+                child.tail = None
+
+
+def _remove_unused_defs(root):
+    """Remove the definitions whose id is not referenced anywhere."""
+    references = set()
+    for element in root.iter():
+        for value in element.attrib.values():
+            references.update(_reference.findall(value))
+        if element.text:
+            references.update(_reference.findall(element.text))
+
+    for defs in list(root.iter(f"{{{SVG_NAMESPACE}}}defs")):
+        for child in list(defs):
+            element_id = child.get("id")
+            if element_id is not None and element_id not in references:
+                defs.remove(child)
+
+    for parent in list(root.iter()):
+        for child in list(parent):
+            if _local_name(child.tag) == "defs" and len(child) == 0:
+                parent.remove(child)
+
+
+def _declared_prefixes(svg):
+    """Get the prefix declared for each namespace in the SVG."""
+    prefixes = {}
+    for _, (prefix, uri) in ET.iterparse(
+        io.BytesIO(svg), events=("start-ns",)
+    ):
+        prefixes.setdefault(uri, prefix)
+    return prefixes
+
+
+def _apply_prefixes(root, prefixes):
+    """
+    Write the names of the tree with the prefixes declared in the SVG.
+
+    The names are rewritten on the tree, instead of registering the prefixes
+    in ElementTree, which would change them for every thread of the process.
+    The SVG namespace is written as the default one, without a prefix, and a
+    namespace without a prefix of its own is left to ElementTree, which
+    generates one.
+    """
+    names = {}
+    for uri, prefix in prefixes.items():
+        if (
+            prefix
+            and uri != SVG_NAMESPACE
+            and not uri.startswith(EDITOR_NAMESPACES)
+            and prefix not in names.values()
+        ):
+            names[uri] = prefix
+    svg_root = _namespace(root.tag) == SVG_NAMESPACE
+    used = {}
+
+    def rename(name):
+        namespace = _namespace(name)
+        if svg_root and namespace == SVG_NAMESPACE:
+            return _local_name(name)
+        if namespace in names:
+            used[namespace] = names[namespace]
+            return f"{names[namespace]}:{_local_name(name)}"
+        return name
+
+    for element in root.iter():
+        element.tag = rename(element.tag)
+        # The attributes are renamed in place, to keep their order.
+        attrib = [(rename(name), value) for name, value in element.items()]
+        element.attrib.clear()
+        element.attrib.update(attrib)
+
+    if svg_root:
+        root.set("xmlns", SVG_NAMESPACE)
+    for uri, prefix in used.items():
+        root.set(f"xmlns:{prefix}", uri)
+
+
+def _optimize(svg, precision):
+    """Optimize an SVG, or return it as it is if it cannot be parsed."""
+    try:
+        prefixes = _declared_prefixes(svg)
+        root = ET.fromstring(svg)
+    except ET.ParseError:
+        return svg
+
+    _clean(root, precision)
+    _remove_unused_defs(root)
+    _apply_prefixes(root, prefixes)
+    optimized = ET.tostring(root, encoding="unicode")
+    # ElementTree escapes ">" in text and attributes, so this is only found
+    # at the end of the empty elements.
+    optimized = optimized.replace(" />", "/>").encode("utf-8")
+
+    return optimized if len(optimized) < len(svg) else svg
+
+
+def optimize_svg(svg, precision=3):
+    """
+    Optimize an SVG, reusing a previous optimization of the same content.
+
+    Parameters
+    ----------
+    svg : bytes
+        The content of the SVG file.
+    precision : int, default=3
+        The number of decimals kept in the numbers of the geometry.
+
+    Returns
+    -------
+    optimized : bytes
+        The optimized SVG, or the original one if it cannot be parsed or
+        would not get smaller.
+    """
+    cache_key = (hashlib.sha256(svg).hexdigest(), precision)
+    optimized = _optimized.get(cache_key)
+    if optimized is None:
+        optimized = _optimize(svg, precision)
+        _optimized.put(cache_key, optimized)
+    return optimized
@@ -0,0 +1,209 @@
+"""
+Opt-in instrumentation of the time spent in each phase of ``st_navbar``.
+
+The instrumentation is disabled by default, in which case timing a phase only
+costs a check of a module flag. Once enabled, the duration of each phase and
+the size of the payloads sent to the frontend are recorded in a registry that
+is shared by every session of the process, and passed to an optional
+listener.
+
+The phases are:
+
+- ``"st_navbar"``: the whole call to ``st_navbar``.
+- ``"validate"``: the checks of the arguments of the spec.
+- ``"validate_call"``: the checks of `selected` and `key`.
+- ``"encode_logo"``: the encoding or serving of the logo.
+- ``"prepare"``: the preparation of `urls`, `styles` and `options`.
+- ``"match_theme"``: the lookup of the UI colors and height in the theme.
+- ``"render_css"``: the render of the CSS adjustments template.
+- ``"emit_css"``: the ``st.html`` element with the CSS adjustments.
+- ``"component"``: the call to the navbar component.
+- ``"render_html"``: the render of the navbar with ``html=True``.
+- ``"import:<page>"``: the import of the module of a page by a ``Router``.
+- ``"page:<page>"``: a render of a page by a ``Router``.
+
+And the sizes, in bytes, are:
+
+- ``"args_bytes"``: the JSON arguments sent to the navbar component.
+- ``"css_bytes"``: the CSS adjustments.
+- ``"logo_source_bytes"``: the SVG file of the logo.
+- ``"logo_svg_bytes"``: the SVG of the logo, after the optional optimization.
+- ``"logo_bytes"``: the logo as sent to the browser, in base64 or as a file.
+
+Examples
+--------
+>>> from streamlit_navigation_bar import timing
+>>> timing.enable()
+>>> # Run the app for a while, then:
+>>> timing.summary()["component"]["p95"]
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+
+# The number of most recent samples kept for each phase or size.
+MAX_SAMPLES = 10_000
+
+_enabled = False
+_listener = None
+_samples = {}
+_lock = threading.Lock()
+
+
+class _Phase():
+    """Time a phase and record its duration on exit."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullPhase():
+    """Do nothing, for when the instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_null_phase = _NullPhase()
+
+
+def enable(listener=None):
+    """
+    Start recording the phases of ``st_navbar``.
+
+    Parameters
+    ----------
+    listener : callable, optional
+        A function called with the name and the value of each record, as
+        ``listener(name, value)``. The value is in seconds for a phase and in
+        bytes for a size. It is called from the thread of the session that
+        made the record. Defaults to ``None``, where the records are only kept
+        in the registry.
+    """
+    global _enabled, _listener
+    _listener = listener
+    _enabled = True
+
+
+def disable():
+    """Stop recording, keeping the records made so far."""
+    global _enabled, _listener
+    _enabled = False
+    _listener = None
+
+
+def is_enabled():
+    """Get whether the phases are being recorded."""
+    return _enabled
+
+
+def reset():
+    """Remove all the records made so far."""
+    with _lock:
+        _samples.clear()
+
+
+def phase(name):
+    """
+    Get a context manager that times a phase, if recording is enabled.
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase.
+    """
+    if not _enabled:
+        return _null_phase
+    return _Phase(name)
+
+
+def timed(name):
+    """Decorate a function to time each call to it as a phase."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record(name, value):
+    """
+    Record a value for a phase or a size.
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase or size.
+    value : float or int
+        The duration in seconds, or the size in bytes.
+    """
+    with _lock:
+        samples = _samples.get(name)
+        if samples is None:
+            samples = _samples[name] = deque(maxlen=MAX_SAMPLES)
+        samples.append(value)
+    listener = _listener
+    if listener is not None:
+        listener(name, value)
+
+
+def _percentile(ordered, fraction):
+    """Get a percentile of ordered values, with the nearest-rank method."""
+    index = max(math.ceil(len(ordered) * fraction) - 1, 0)
+    return ordered[index]
+
+
+def summary():
+    """
+    Aggregate the records of every session in the process.
+
+    Returns
+    -------
+    summary : dict of {str : dict of {str : float}}
+        A dictionary with the name of each phase or size as the key, and its
+        ``"count"``, ``"mean"``, ``"p50"``, ``"p95"``, ``"p99"`` and
+        ``"max"`` as the value. Phases are in milliseconds and sizes in bytes.
+    """
+    with _lock:
+        snapshot = {name: list(samples) for name, samples in _samples.items()}
+
+    result = {}
+    for name, values in snapshot.items():
+        if not values:
+            continue
+        scale = 1 if name.endswith("_bytes") else 1000
+        ordered = sorted(value * scale for value in values)
+        result[name] = {
+            "count": len(ordered),
+            "mean": sum(ordered) / len(ordered),
+            "p50": _percentile(ordered, 0.50),
+            "p95": _percentile(ordered, 0.95),
+            "p99": _percentile(ordered, 0.99),
+            "max": ordered[-1],
+        }
+    return result
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from streamlit_navigation_bar import core
+
+
+def redirect_app():
+    import streamlit as st
+    from streamlit_navigation_bar import set_page, st_navbar
+
+    def redirect():
+        if st.session_state["nav"] == "B":
+            set_page("nav", "C")
+
+    st.session_state["page"] = st_navbar(
+        ["A", "B", "C"], key="nav", on_change=redirect
+    )
+
+
+def get_default(app_test):
+    """Get the page the navbar was told to highlight."""
+    for node in app_test.main:
+        if getattr(node, "type", None) == "component_instance":
+            return json.loads(node.proto.json_args)["default"]
+    raise AssertionError("The navbar component was not found.")
+
+
+@pytest.mark.skipif(
+    core._NATIVE_CALLBACK,
+    reason="AppTest cannot make Streamlit run the callback of a component",
+)
+def test_on_change_redirect_is_highlighted_in_same_rerun():
+    app_test = AppTest.from_function(redirect_app)
+    app_test.run(timeout=30)
+    assert get_default(app_test) == "A"
+
+    # The navbar returns a click on "B".
+    app_test.session_state["st_navbar_nav"] = {
+        "page": "B",
+        "theme": None,
+        "version": None,
+        "clicks": 1,
+        "intent": None,
+    }
+    app_test.run(timeout=30)
+
+    assert not app_test.exception
+    assert app_test.session_state["page"] == "C"
+    assert get_default(app_test) == "C"
+
+
+def prefetch_app():
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    prefetched = st.session_state.setdefault("prefetched", [])
+    st.session_state["page"] = st_navbar(
+        ["A", "B", "C"], key="nav", on_prefetch=prefetched.append
+    )
+
+
+@pytest.mark.skipif(
+    core._NATIVE_CALLBACK,
+    reason="AppTest cannot make Streamlit run the callback of a component",
+)
+def test_repeated_intent_prefetches_once():
+    app_test = AppTest.from_function(prefetch_app)
+    app_test.run(timeout=30)
+
+    # The navbar reports the intent to select "B", then reruns the app with
+    # the same value, e.g. after reporting the theme.
+    for theme in (None, {"base": "dark"}):
+        app_test.session_state["st_navbar_nav"] = {
+            "page": "A",
+            "theme": theme,
+            "version": None,
+            "clicks": 0,
+            "intent": "B",
+        }
+        app_test.run(timeout=30)
+        assert not app_test.exception
+
+    assert app_test.session_state["prefetched"] == ["B"]
+    assert app_test.session_state["page"] == "A"
@@ -0,0 +1,54 @@
+import pytest
+from streamlit.errors import StreamlitAPIException
+
+from streamlit_navigation_bar import errors
+
+
+def check_spec(pages, **kwargs):
+    """Check the arguments of a navbar, with the defaults of st_navbar."""
+    arguments = dict(
+        logo_path=None,
+        logo_page="Home",
+        urls=None,
+        styles=None,
+        options=True,
+        adjust=True,
+        serve_logo=False,
+        optimize_logo=False,
+        logo_budget=None,
+        html=False,
+    )
+    arguments.update(kwargs)
+    errors.check_spec(pages, **arguments)
+
+
+def test_check_pages_rejects_duplicate_names():
+    with pytest.raises(StreamlitAPIException, match="duplicate"):
+        errors.check_pages(["Home", "Docs", "Home"])
+
+
+def test_check_pages_accepts_unique_names():
+    errors.check_pages(["Home", "Docs"])
+
+
+def test_invalid_arguments_raise_on_every_call():
+    pages = ["Home", "Home"]
+    for _ in range(2):
+        with pytest.raises(StreamlitAPIException, match="duplicate"):
+            check_spec(pages)
+
+
+def test_valid_arguments_are_checked_once():
+    errors._validated.clear()
+    pages = ["Home", "Docs"]
+    check_spec(pages, options={"show_menu": False})
+    check_spec(pages, options={"show_menu": False})
+    info = errors._validated.info()
+    assert info["misses"] == 1
+    assert info["hits"] == 1
+
+
+def test_equal_options_of_another_type_are_checked_again():
+    check_spec(["Home"], options={"show_menu": True})
+    with pytest.raises(StreamlitAPIException):
+        check_spec(["Home"], options={"show_menu": 1})
@@ -0,0 +1,96 @@
+from streamlit.testing.v1 import AppTest
+
+
+def read_page_app():
+    import streamlit as st
+    from streamlit_navigation_bar import html_navbar
+
+    st.session_state["page"] = html_navbar.read_page(
+        "page", frozenset(["Home", "Docs"]), st.session_state["logo_page"]
+    )
+
+
+def render_app():
+    import streamlit as st
+    from streamlit_navigation_bar import html_navbar
+
+    args = {
+        "pages": ["Home", "<b>Docs</b>", "GitHub"],
+        "base64_svg": None,
+        "logo_url": None,
+        "logo_page": None,
+        "urls": {
+            "Home": ("#", "_self"),
+            "<b>Docs</b>": ("#", "_self"),
+            "GitHub": ("https://github.com", "_blank"),
+        },
+    }
+    st.session_state["html"] = html_navbar.render_navbar(args, "Home", "page")
+
+
+def callback_app():
+    from streamlit_navigation_bar import st_navbar
+
+    st_navbar(["Home", "Docs"], html=True, on_change=lambda: None)
+
+
+def navbar_app():
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    st.session_state["page"] = st_navbar(["Home", "Docs"], html=True)
+
+
+def read_page(query, logo_page=None):
+    app_test = AppTest.from_function(read_page_app)
+    app_test.session_state["logo_page"] = logo_page
+    for name, value in query.items():
+        app_test.query_params[name] = value
+    app_test.run(timeout=30)
+    assert not app_test.exception
+    return app_test.session_state["page"]
+
+
+def test_read_page_gets_a_page_of_the_navbar():
+    assert read_page({"page": "Docs"}) == "Docs"
+
+
+def test_read_page_ignores_unknown_pages():
+    assert read_page({"page": "Admin"}) is None
+    assert read_page({}) is None
+
+
+def test_read_page_gets_the_logo_page_only_with_a_logo():
+    assert read_page({"page": "Logo"}) is None
+    assert read_page({"page": "Logo"}, logo_page="Logo") == "Logo"
+
+
+def test_render_navbar_escapes_page_names():
+    app_test = AppTest.from_function(render_app).run(timeout=30)
+    html = app_test.session_state["html"]
+    assert "<b>" not in html
+    assert 'data-text="&lt;b&gt;Docs&lt;/b&gt;"' in html
+
+
+def test_render_navbar_keeps_other_query_params():
+    app_test = AppTest.from_function(render_app)
+    app_test.query_params["lang"] = "en"
+    app_test.query_params["page"] = "Home"
+    app_test.run(timeout=30)
+    html = app_test.session_state["html"]
+    assert 'href="?lang=en&amp;page=Home"' in html
+    assert 'href="https://github.com"' in html
+    assert 'rel="noopener noreferrer"' in html
+
+
+def test_callbacks_are_rejected_with_html():
+    app_test = AppTest.from_function(callback_app).run(timeout=30)
+    assert "cannot be used when html is True" in app_test.exception[0].message
+
+
+def test_st_navbar_returns_the_page_in_the_query():
+    app_test = AppTest.from_function(navbar_app)
+    app_test.query_params["page"] = "Docs"
+    app_test.run(timeout=30)
+    assert not app_test.exception
+    assert app_test.session_state["page"] == "Docs"
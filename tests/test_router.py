@@ -0,0 +1,99 @@
+import sys
+import textwrap
+import threading
+
+import pytest
+from streamlit.errors import StreamlitAPIException
+
+from streamlit_navigation_bar import Router, router
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    """Write page modules to a directory on the import path."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    names = []
+
+    def write(name, source):
+        path = tmp_path / f"{name}.py"
+        path.write_text(textwrap.dedent(source))
+        names.append(name)
+
+    yield write
+    for name in names:
+        sys.modules.pop(name, None)
+        for path in list(router._targets):
+            if path.startswith(f"{name}:"):
+                del router._targets[path]
+
+
+def test_resolve_imports_the_function_at_the_path(modules):
+    modules("router_home", "def home():\n    return 'home'\n")
+    pages = Router({"Home": "router_home:home"})
+    assert "router_home" not in sys.modules
+
+    function = pages.resolve("Home")
+    assert function() == "home"
+    assert pages.resolve("Home") is function
+
+
+def test_resolve_returns_a_callable_as_it_is():
+    def page():
+        pass
+
+    assert Router({"Home": page}).resolve("Home") is page
+
+
+@pytest.mark.parametrize(
+    "target, match",
+    [
+        (42, "invalid type"),
+        ("router_home", "invalid path"),
+        ("router_home:", "invalid path"),
+    ],
+)
+def test_invalid_targets_are_rejected(target, match):
+    with pytest.raises(StreamlitAPIException, match=match):
+        Router({"Home": target})
+
+
+def test_unknown_page_is_rejected():
+    with pytest.raises(StreamlitAPIException, match="not in the router"):
+        Router({"Home": lambda: None}).resolve("Docs")
+
+
+def test_a_slow_import_does_not_block_other_pages(modules):
+    modules(
+        "router_slow",
+        """
+        import threading
+        started = threading.Event()
+        release = threading.Event()
+        started.set()
+        release.wait(10)
+
+
+        def page():
+            return "slow"
+        """,
+    )
+    modules("router_fast", "def page():\n    return 'fast'\n")
+    pages = Router({"Slow": "router_slow:page", "Fast": "router_fast:page"})
+
+    def get_slow_module():
+        # The module is in sys.modules as soon as its import starts.
+        while not hasattr(sys.modules.get("router_slow"), "release"):
+            thread.join(0.01)
+        return sys.modules["router_slow"]
+
+    thread = threading.Thread(target=pages.resolve, args=("Slow",))
+    thread.start()
+    try:
+        get_slow_module().started.wait(10)
+        # Resolved while the other module is still being imported.
+        assert pages.resolve("Fast")() == "fast"
+        assert thread.is_alive()
+    finally:
+        get_slow_module().release.set()
+        thread.join(10)
+    assert pages.resolve("Slow")() == "slow"
@@ -0,0 +1,77 @@
+import copy
+import pickle
+
+import pytest
+from streamlit.errors import StreamlitAPIException
+
+from streamlit_navigation_bar import NavbarSpec
+from streamlit_navigation_bar.errors import check_spec_args
+
+
+@pytest.fixture
+def spec():
+    return NavbarSpec.build(
+        ["Home", "Docs", "GitHub"],
+        urls={"GitHub": "https://github.com"},
+        styles={"nav": {"background-color": "royalblue"}},
+        options={"use_padding": False},
+    )
+
+
+def test_attributes_cannot_be_set(spec):
+    with pytest.raises(AttributeError):
+        spec.adjust = False
+    with pytest.raises(AttributeError):
+        del spec.pages
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda spec: spec.options.update(use_padding=True),
+        lambda spec: spec.urls.pop("Home"),
+        lambda spec: spec.styles["nav"].clear(),
+        lambda spec: spec._args.update(pages=[]),
+    ],
+)
+def test_mappings_are_read_only(spec, mutate):
+    with pytest.raises((TypeError, AttributeError)):
+        mutate(spec)
+
+
+def test_pickle_restores_an_equal_spec(spec):
+    restored = pickle.loads(pickle.dumps(spec))
+    assert restored == spec
+    assert hash(restored) == hash(spec)
+    assert restored.options["use_padding"] is False
+    assert restored.styles["nav"]["background-color"] == "royalblue"
+    with pytest.raises(TypeError):
+        restored.options["use_padding"] = True
+
+
+def test_copy_returns_the_same_spec(spec):
+    assert copy.copy(spec) is spec
+    assert copy.deepcopy(spec) is spec
+
+
+def test_check_spec_args_accepts_the_defaults():
+    check_spec_args(
+        logo_path=(None, None),
+        options=(True, True),
+        adjust=(True, True),
+    )
+
+
+@pytest.mark.parametrize(
+    "name, value, default",
+    [
+        ("adjust", False, True),
+        ("adjust", 1, True),
+        ("options", 1, True),
+        ("logo_page", "Docs", "Home"),
+        ("styles", {}, None),
+    ],
+)
+def test_check_spec_args_rejects_overrides(name, value, default):
+    with pytest.raises(StreamlitAPIException, match=name):
+        check_spec_args(**{name: (value, default)})
@@ -0,0 +1,69 @@
+import json
+
+from streamlit.testing.v1 import AppTest
+
+STATIC_ARGS = {"pages", "base64_svg", "logo_url", "logo_page", "urls"}
+
+
+def navbar_app():
+    import streamlit as st
+    from streamlit_navigation_bar import st_navbar
+
+    st_navbar(st.session_state.get("pages", ["A", "B"]), key="nav")
+    st.button("rerun")
+
+
+def get_args(app_test):
+    """Get the arguments sent to the navbar component."""
+    for node in app_test.main:
+        if getattr(node, "type", None) == "component_instance":
+            return json.loads(node.proto.json_args)
+    raise AssertionError("The navbar component was not found.")
+
+
+def test_static_args_are_sent_once():
+    app_test = AppTest.from_function(navbar_app)
+    app_test.run(timeout=30)
+    assert STATIC_ARGS <= set(get_args(app_test))
+
+    # A rerun triggered by another widget.
+    app_test.button[0].click().run(timeout=30)
+    args = get_args(app_test)
+    assert not STATIC_ARGS & set(args)
+    assert "version" in args
+
+
+def test_static_args_are_sent_again_for_a_new_version():
+    app_test = AppTest.from_function(navbar_app)
+    app_test.run(timeout=30)
+    version = get_args(app_test)["version"]
+
+    app_test.session_state["pages"] = ["A", "B", "C"]
+    app_test.run(timeout=30)
+    args = get_args(app_test)
+    assert args["version"] != version
+    assert args["pages"] == ["A", "B", "C"]
+
+    app_test.run(timeout=30)
+    assert "pages" not in get_args(app_test)
+
+
+def test_static_args_are_sent_again_when_the_navbar_lost_them():
+    app_test = AppTest.from_function(navbar_app)
+    app_test.run(timeout=30)
+    app_test.run(timeout=30)
+    assert "pages" not in get_args(app_test)
+
+    # The navbar reports that it holds no version, e.g. after a remount.
+    app_test.session_state["st_navbar_nav"] = {
+        "page": "A",
+        "theme": None,
+        "version": None,
+        "clicks": 0,
+        "intent": None,
+    }
+    app_test.run(timeout=30)
+    assert get_args(app_test)["pages"] == ["A", "B"]
+
+    app_test.run(timeout=30)
+    assert "pages" not in get_args(app_test)
@@ -0,0 +1,108 @@
+import re
+import xml.etree.ElementTree as ET
+
+from streamlit_navigation_bar.svg import optimize_svg
+
+
+def get_path_data(svg):
+    """Get the d attribute of the path of an SVG."""
+    return re.search(rb' d="([^"]*)"', svg).group(1).decode("utf-8")
+
+
+def make_svg(d):
+    """Make an SVG with a path and enough metadata to be optimized."""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        "<!-- Exported by an editor. -->\n"
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 40 40">\n'
+        f'  <path d="{d}"/>\n'
+        "</svg>\n"
+    ).encode("utf-8")
+
+
+def test_compact_arc_flags_are_kept():
+    optimized = optimize_svg(make_svg("M10 10a5 5 0 0110 10"))
+    assert get_path_data(optimized) == "M10 10a5 5 0 0110 10"
+
+
+def test_arc_flags_before_a_decimal_are_kept():
+    optimized = optimize_svg(make_svg("M10 10a5 5 0 010.500 2.000"))
+    assert get_path_data(optimized) == "M10 10a5 5 0 01.5 2"
+
+
+def test_numbers_stay_apart_when_a_point_is_dropped():
+    optimized = optimize_svg(make_svg("M1.0.5L2.000 3.50"))
+    assert get_path_data(optimized) == "M1 .5L2 3.5"
+
+
+EDITOR_SVG = b"""<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<!-- Created with Inkscape (http://www.inkscape.org/) -->
+<svg
+   xmlns="http://www.w3.org/2000/svg"
+   xmlns:xlink="http://www.w3.org/1999/xlink"
+   xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+   xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"
+   xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+   xmlns:dc="http://purl.org/dc/elements/1.1/"
+   viewBox="0 0 40 40"
+   inkscape:version="1.3">
+  <sodipodi:namedview id="namedview" inkscape:zoom="1.0" />
+  <metadata>
+    <rdf:RDF>
+      <rdf:Description><dc:title>Logo</dc:title></rdf:Description>
+    </rdf:RDF>
+  </metadata>
+  <defs>
+    <linearGradient id="used"><stop offset="0" /></linearGradient>
+    <linearGradient id="unused"><stop offset="1" /></linearGradient>
+  </defs>
+  <g inkscape:label="Layer" sodipodi:insensitive="true">
+    <!-- The shape. -->
+    <path d="M10.000 10.000a5 5 0 0110 10" fill="url(#used)" />
+    <use xlink:href="#shape" x="1.25000" />
+  </g>
+</svg>
+"""
+
+
+def test_comments_are_removed():
+    optimized = optimize_svg(EDITOR_SVG)
+    assert b"<!--" not in optimized
+    assert b"<?xml" not in optimized
+
+
+def test_metadata_is_removed():
+    optimized = optimize_svg(EDITOR_SVG)
+    assert b"metadata" not in optimized
+    assert b"rdf" not in optimized
+    assert b"Logo" not in optimized
+
+
+def test_editor_namespaces_are_removed():
+    optimized = optimize_svg(EDITOR_SVG)
+    assert b"inkscape" not in optimized
+    assert b"sodipodi" not in optimized
+    assert b"namedview" not in optimized
+
+
+def test_unused_defs_are_removed():
+    optimized = optimize_svg(EDITOR_SVG)
+    assert b'id="used"' in optimized
+    assert b'id="unused"' not in optimized
+
+
+def test_arc_flags_survive_a_round_trip():
+    optimized = optimize_svg(EDITOR_SVG)
+    root = ET.fromstring(optimized)
+    path = root.find(".//{http://www.w3.org/2000/svg}path")
+    assert path.get("d") == "M10 10a5 5 0 0110 10"
+    assert optimize_svg(optimized) == optimized
+
+
+def test_prefixes_are_kept_without_registering_them():
+    namespaces = dict(ET._namespace_map)
+    optimized = optimize_svg(EDITOR_SVG)
+    assert ET._namespace_map == namespaces
+    assert b'xmlns="http://www.w3.org/2000/svg"' in optimized
+    assert b'xmlns:xlink="http://www.w3.org/1999/xlink"' in optimized
+    assert b'<use xlink:href="#shape" x="1.25"/>' in optimized